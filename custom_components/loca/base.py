@@ -2,27 +2,38 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
 
+# Shared read-only fallback for devices missing from the coordinator snapshot
+_EMPTY_DEVICE_DATA: Mapping[str, Any] = MappingProxyType({})
+
 
 class LocaEntityMixin:
-    """Mixin class providing common functionality for Loca entities."""
+    """Mixin class providing common functionality for Loca entities.
+
+    Must precede CoordinatorEntity in the bases so its __init__ can hand the
+    coordinator on through the MRO.
+    """
+
+    coordinator: Any
 
     def __init__(self, coordinator: Any, device_id: str) -> None:
-        """Initialize the mixin."""
-        self.coordinator = coordinator
+        """Initialize the mixin and the coordinator entity after it."""
         self._device_id = device_id
+        super().__init__(coordinator)  # type: ignore[call-arg]
 
     @property
-    def device_data(self) -> dict[str, Any]:
+    def device_data(self) -> Mapping[str, Any]:
         """Return device data from coordinator."""
         if self.coordinator.data is None:
-            return {}
-        return self.coordinator.data.get(self._device_id, {})
+            return _EMPTY_DEVICE_DATA
+        return self.coordinator.data.get(self._device_id, _EMPTY_DEVICE_DATA)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -50,13 +50,12 @@ class LocaDeviceTracker(LocaEntityMixin, CoordinatorEntity, TrackerEntity):
     """Representation of a Loca device tracker."""
 
     _attr_has_entity_name = True
+    _attr_name = None  # Use device name
 
     def __init__(self, coordinator: LocaDataUpdateCoordinator, device_id: str) -> None:
         """Initialize the device tracker."""
-        LocaEntityMixin.__init__(self, coordinator, device_id)
-        CoordinatorEntity.__init__(self, coordinator)
+        super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{DOMAIN}_{device_id}"
-        self._attr_name = None  # Use device name
 
     @property
     def name(self) -> str | None:
@@ -21,6 +21,7 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = config_entry.runtime_data
+    api = coordinator.api
 
     # Gather coordinator data (mask sensitive information)
     diagnostics_data: dict[str, Any] = {
@@ -46,7 +47,7 @@ async def async_get_config_entry_diagnostics(
             "device_count": len(coordinator.data) if coordinator.data else 0,
         },
         "api_info": {
-            "authenticated": coordinator.api.is_authenticated,
+            "authenticated": api.is_authenticated,
             "base_url": "https://api.loca.nl/v1",  # Static, non-sensitive URL
             "endpoints_used": [
                 "Login.json",
@@ -56,37 +57,17 @@ async def async_get_config_entry_diagnostics(
                 "Groups.json",
             ],
             # Don't expose actual API credentials - only indicate if they're configured
-            "credentials_configured": coordinator.api.has_credentials,
-            "groups_cache_size": coordinator.api.groups_cache_size,
+            "credentials_configured": api.has_credentials,
+            "groups_cache_size": api.groups_cache_size,
         },
     }
 
-    # Add device information (include all data for diagnostics)
+    # Add device information with privacy-sensitive fields redacted
     if coordinator.data:
-        devices_info = []
-        for device_id, device_data in coordinator.data.items():
-            # Include device data with privacy-sensitive information redacted
-            device_info = {
-                "device_id": device_id,
-                "name": device_data.get("name", "Unknown"),
-                "battery_level": device_data.get("battery_level"),
-                "latitude": "**REDACTED**"
-                if device_data.get("latitude") is not None
-                else None,
-                "longitude": "**REDACTED**"
-                if device_data.get("longitude") is not None
-                else None,
-                "has_gps_data": device_data.get("latitude") is not None
-                and device_data.get("longitude") is not None,
-                "gps_accuracy": device_data.get("gps_accuracy"),
-                "last_seen": device_data.get("last_seen").isoformat()
-                if device_data.get("last_seen")
-                else None,
-                "asset_info": device_data.get("asset_info"),
-            }
-            devices_info.append(device_info)
-
-        diagnostics_data["devices"] = devices_info
+        diagnostics_data["devices"] = [
+            _redact_device(device_id, device_data)
+            for device_id, device_data in coordinator.data.items()
+        ]
 
     return diagnostics_data
 
@@ -114,20 +95,7 @@ async def async_get_device_diagnostics(
 
     # Return device data with sensitive location information redacted
     return {
-        "device_id": device_id,
-        "name": device_data.get("name", "Unknown"),
-        "battery_level": device_data.get("battery_level"),
-        "latitude": "**REDACTED**" if device_data.get("latitude") is not None else None,
-        "longitude": "**REDACTED**"
-        if device_data.get("longitude") is not None
-        else None,
-        "has_gps_data": device_data.get("latitude") is not None
-        and device_data.get("longitude") is not None,
-        "gps_accuracy": device_data.get("gps_accuracy"),
-        "last_seen": device_data.get("last_seen").isoformat()
-        if device_data.get("last_seen")
-        else None,
-        "asset_info": device_data.get("asset_info"),
+        **_redact_device(device_id, device_data),
         "address": "**REDACTED**" if device_data.get("address") else None,
         "speed": device_data.get("speed"),
         "heading": device_data.get("heading"),
@@ -136,3 +104,21 @@ async def async_get_device_diagnostics(
         "is_online": device_data.get("is_online"),
         "motion_state": device_data.get("motion_state"),
     }
+
+
+def _redact_device(device_id: str, device_data: dict[str, Any]) -> dict[str, Any]:
+    """Return the diagnostics summary shared by entry and device diagnostics."""
+    has_latitude = device_data.get("latitude") is not None
+    has_longitude = device_data.get("longitude") is not None
+    last_seen = device_data.get("last_seen")
+    return {
+        "device_id": device_id,
+        "name": device_data.get("name", "Unknown"),
+        "battery_level": device_data.get("battery_level"),
+        "latitude": "**REDACTED**" if has_latitude else None,
+        "longitude": "**REDACTED**" if has_longitude else None,
+        "has_gps_data": has_latitude and has_longitude,
+        "gps_accuracy": device_data.get("gps_accuracy"),
+        "last_seen": last_seen.isoformat() if last_seen else None,
+        "asset_info": device_data.get("asset_info"),
+    }
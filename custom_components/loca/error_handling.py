@@ -8,6 +8,7 @@ import logging
 from typing import Any, TypeVar
 
 from aiohttp import ClientConnectorError, ServerTimeoutError
+import voluptuous as vol
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -100,8 +101,12 @@ def handle_api_errors(
         async def wrapper(*args: Any, **kwargs: Any) -> T | Any:
             try:
                 return await func(*args, **kwargs)
+            except CONNECTION_ERROR_TYPES as err:
+                # Transient network issue: warn without formatting a traceback
+                log_connectivity_error(_LOGGER, log_prefix, err)
+                return default_return
             except Exception as err:
-                _LOGGER.exception(f"{log_prefix} failed: %s", err)
+                _LOGGER.exception("%s failed: %s", log_prefix, err)
                 return default_return
 
         return wrapper
@@ -130,8 +135,8 @@ def handle_config_flow_errors(
 
             # Return form with errors
             return self.async_show_form(
-                step_id=getattr(self, "_current_step", "user"),
-                data_schema=getattr(self, "_schema", {}),
+                step_id=self._current_step,
+                data_schema=self._schema,
                 errors=errors,
             )
         return await func(self, user_input)
@@ -154,6 +159,10 @@ class ConfigFlowErrorMixin:
     CannotConnect: type[Exception]
     InvalidAuth: type[Exception]
 
+    # Defaults used by handle_config_flow_errors when re-showing the form
+    _current_step: str = "user"
+    _schema: vol.Schema | dict[str, Any] = {}
+
     def handle_validation_errors(
         self,
         validation_func: Callable[[dict[str, Any]], Any],
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import logging
 
 from homeassistant.components.repairs import ConfirmRepairFlow, RepairsFlow
@@ -21,17 +22,8 @@ async def async_create_fix_flow(
     data: dict[str, str | int | float | None] | None,
 ) -> RepairsFlow:
     """Create flow."""
-    if issue_id == "deprecated_yaml_configuration":
-        return DeprecatedYamlConfigurationRepairFlow()
-    if issue_id == "api_authentication_failed":
-        entry_id = (
-            str(data["entry_id"]) if data and data.get("entry_id") is not None else None
-        )
-        return ApiAuthenticationFailedRepairFlow(entry_id=entry_id)
-    if issue_id == "no_devices_found":
-        return NoDevicesFoundRepairFlow()
-
-    return ConfirmRepairFlow()
+    factory = _FIX_FLOW_FACTORIES.get(issue_id)
+    return factory(data) if factory else ConfirmRepairFlow()
 
 
 class DeprecatedYamlConfigurationRepairFlow(RepairsFlow):
@@ -110,6 +102,30 @@ class NoDevicesFoundRepairFlow(RepairsFlow):
         )
 
 
+def _entry_id_from_issue_data(
+    data: dict[str, str | int | float | None] | None,
+) -> str | None:
+    """Return the config entry id stored on an issue, if any."""
+    if data and data.get("entry_id") is not None:
+        return str(data["entry_id"])
+    return None
+
+
+# Dispatch table mapping issue_id → factory building the matching repair flow.
+# Unknown issue ids fall back to a plain ConfirmRepairFlow.
+_FIX_FLOW_FACTORIES: dict[
+    str, Callable[[dict[str, str | int | float | None] | None], RepairsFlow]
+] = {
+    "deprecated_yaml_configuration": lambda _data: (
+        DeprecatedYamlConfigurationRepairFlow()
+    ),
+    "api_authentication_failed": lambda data: ApiAuthenticationFailedRepairFlow(
+        entry_id=_entry_id_from_issue_data(data)
+    ),
+    "no_devices_found": lambda _data: NoDevicesFoundRepairFlow(),
+}
+
+
 def async_create_issue(
     hass: HomeAssistant,
     issue_id: str,
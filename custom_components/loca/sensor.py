@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from itertools import product
+from math import isfinite
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,7 +16,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -76,6 +80,70 @@ SENSOR_TYPES = {
 }
 
 
+# Bound once; the asset_info icon is resolved on every state write
+_ICON_GET = LOCA_ASSET_TYPE_ICONS.get
+
+# Optional device data keys copied into sensor attributes: (source key, attribute)
+_ASSET_INFO_EXTRA: tuple[tuple[str, str], ...] = (
+    ("signal_strength", "gsm_signal_strength"),
+    ("location_label", "location_label"),
+    ("address", "address"),
+)
+_LOCATION_EXTRA: tuple[tuple[str, str], ...] = (
+    ("location_label", "location_label"),
+    ("address", "full_address"),
+    ("satellites", "satellites"),
+)
+
+
+@lru_cache(maxsize=128)
+def _format_time_of_day(timeofday: int | float) -> str:
+    """Format a finite, numeric location-update timeofday value as HH:MM."""
+    timeofday = int(timeofday)
+    if timeofday >= 1000:
+        # HHMM00 format (e.g., 91000 = 9:10)
+        hours, remainder = divmod(timeofday, 10000)
+        minutes = remainder // 100
+    else:
+        # Fallback: treat as seconds since midnight
+        timeofday = abs(timeofday) % TimeConstants.SECONDS_PER_DAY
+        hours, remainder = divmod(timeofday, TimeConstants.SECONDS_PER_HOUR)
+        minutes = remainder // TimeConstants.SECONDS_PER_MINUTE
+
+    # Ensure valid time range using constants
+    hours = min(TimeConstants.HOURS_PER_DAY - 1, max(0, hours))
+    minutes = min(TimeConstants.MINUTES_PER_HOUR - 1, max(0, minutes))
+    return f"{hours:02d}:{minutes:02d}"
+
+
+@lru_cache(maxsize=64, typed=True)
+def _format_frequency(frequency: int | float) -> str:
+    """Describe a location-update frequency in its largest whole unit."""
+    if frequency >= TimeConstants.SECONDS_PER_DAY:
+        return f"{frequency // TimeConstants.SECONDS_PER_DAY} day(s)"
+    if frequency >= TimeConstants.SECONDS_PER_HOUR:
+        return f"{frequency // TimeConstants.SECONDS_PER_HOUR} hour(s)"
+    if frequency >= TimeConstants.SECONDS_PER_MINUTE:
+        return f"{frequency // TimeConstants.SECONDS_PER_MINUTE} minute(s)"
+    return f"{frequency} second(s)"
+
+
+@lru_cache(maxsize=256, typed=True)
+def _format_accuracy(gps_accuracy: int | float) -> str:
+    """Format a GPS accuracy in metres."""
+    return f"{gps_accuracy}m"
+
+
+def _build_sensors(
+    coordinator: LocaDataUpdateCoordinator, device_ids: Iterable[str]
+) -> list[LocaSensor]:
+    """Create one sensor of every type for each device id."""
+    return [
+        sensor_class(coordinator, device_id)
+        for device_id, sensor_class in product(device_ids, _SENSOR_CLASSES.values())
+    ]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -85,13 +153,7 @@ async def async_setup_entry(
     coordinator: LocaDataUpdateCoordinator = config_entry.runtime_data
 
     known_device_ids: set[str] = set(coordinator.data)
-    async_add_entities(
-        [
-            LocaSensor(coordinator, device_id, sensor_type)
-            for device_id in known_device_ids
-            for sensor_type in SENSOR_TYPES
-        ]
-    )
+    async_add_entities(_build_sensors(coordinator, known_device_ids))
 
     def _async_add_new_devices() -> None:
         """Create sensor entities for devices discovered after initial setup."""
@@ -99,81 +161,132 @@ async def async_setup_entry(
         if not new_ids:
             return
         known_device_ids.update(new_ids)
-        async_add_entities(
-            [
-                LocaSensor(coordinator, device_id, sensor_type)
-                for device_id in new_ids
-                for sensor_type in SENSOR_TYPES
-            ]
-        )
+        async_add_entities(_build_sensors(coordinator, new_ids))
 
     config_entry.async_on_unload(coordinator.async_add_listener(_async_add_new_devices))
 
 
 class LocaSensor(LocaEntityMixin, CoordinatorEntity, SensorEntity):
-    """Representation of a Loca sensor."""
+    """Base class for Loca sensors.
+
+    Each subclass is bound to one key of SENSOR_TYPES via ``_sensor_type``.
+    """
 
     _attr_has_entity_name = True
+    _sensor_type: str
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Bind the entity description of the subclass's sensor type."""
+        super().__init_subclass__(**kwargs)
+        # Shared by every instance of the subclass instead of stored per entity
+        cls.entity_description = SENSOR_TYPES[cls._sensor_type]
 
     def __init__(
         self,
         coordinator: LocaDataUpdateCoordinator,
         device_id: str,
-        sensor_type: str,
     ) -> None:
         """Initialize the sensor."""
-        LocaEntityMixin.__init__(self, coordinator, device_id)
-        CoordinatorEntity.__init__(self, coordinator)
-        self._sensor_type = sensor_type
-        self.entity_description = SENSOR_TYPES[sensor_type]
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_{sensor_type}"
-        # Entity name is handled by entity_description
+        super().__init__(coordinator, device_id)
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{self._sensor_type}"
+        # Resolve name and icon from entity_description once, not per state write
+        name = self.entity_description.name
+        self._attr_name = str(name) if name else None
+        self._attr_icon = self.entity_description.icon
+        self._device_data: Mapping[str, Any] = self.device_data
+        self._attributes: dict[str, Any] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached device snapshot before writing state.
+
+        The coordinator replaces each device's dict on every successful update,
+        so the built attributes are kept only while the snapshot is the same
+        object.
+        """
+        device_data = self.device_data
+        if device_data is not self._device_data:
+            self._device_data = device_data
+            self._attributes = None
+        super()._handle_coordinator_update()
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the device snapshot."""
+        return {}
 
     @property
-    def name(self) -> str | None:
-        """Return the name of the sensor."""
-        name = self.entity_description.name
-        if name is None or name == "":
-            return None
-        return str(name)
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        if self._attributes is None:
+            self._attributes = self._build_extra_state_attributes()
+        return self._attributes
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self._device_id in self.coordinator.data
+
+
+class LocaBatterySensor(LocaSensor):
+    """Battery level of a Loca device."""
+
+    _sensor_type = "battery"
 
     @property
     def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        resolver = _NATIVE_VALUE_RESOLVERS.get(self._sensor_type)
-        return resolver(self) if resolver else None
+        """Return the battery level."""
+        return self._device_data.get("battery_level")
 
-    def _native_value_asset_info(self) -> str:
-        """Compose a brand/model summary for the asset_info sensor."""
-        asset_info = self.device_data.get("asset_info", {})
-        brand = asset_info.get("brand", "")
-        model = asset_info.get("model", "")
-        if brand and model:
-            return f"{brand} {model}"
-        return brand or model or "Unknown Asset"
 
-    def _native_value_location_update(self) -> str:
-        """Summarise location-update configuration."""
-        location_update = self.device_data.get("location_update", {})
-        if not location_update:
-            return "Not configured"
-        return "Always on" if location_update.get("always", 0) == 1 else "Scheduled"
+class LocaLastSeenSensor(LocaSensor):
+    """Timestamp of the last report from a Loca device."""
 
-    def _native_value_location(self) -> str:
-        """Return the formatted address or the unknown-location fallback."""
-        return self.device_data.get("address") or "Unknown location"
+    _sensor_type = "last_seen"
+
+    @property
+    def native_value(self) -> Any:
+        """Return the last seen timestamp."""
+        return self._device_data.get("last_seen")
 
-    def _get_last_seen_attributes(self) -> dict[str, Any]:
-        """Get attributes for last_seen sensor."""
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the device snapshot."""
         attributes = {}
-        if location_source := self.device_data.get("location_source"):
+        if location_source := self._device_data.get("location_source"):
             attributes["location_source"] = location_source
         return attributes
 
-    def _get_asset_info_attributes(self) -> dict[str, Any]:
-        """Get attributes for asset_info sensor."""
+
+class LocaLocationAccuracySensor(LocaSensor):
+    """GPS accuracy of a Loca device."""
+
+    _sensor_type = "location_accuracy"
+
+    @property
+    def native_value(self) -> Any:
+        """Return the GPS accuracy."""
+        return self._device_data.get("gps_accuracy")
+
+
+class LocaAssetInfoSensor(LocaSensor):
+    """Asset brand/model summary of a Loca device."""
+
+    _sensor_type = "asset_info"
+
+    @property
+    def native_value(self) -> str:
+        """Compose a brand/model summary."""
+        asset_info = self._device_data.get("asset_info", {})
+        brand = asset_info.get("brand", "")
+        model = asset_info.get("model", "")
+        if brand and model:
+            return f"{brand} {model}"
+        return brand or model or "Unknown Asset"
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the device snapshot."""
+        device_data = self._device_data
         attributes = {}
-        asset_info = self.device_data.get("asset_info", {})
+        asset_info = device_data.get("asset_info", {})
         if asset_info:
             attributes.update(
                 {
@@ -186,100 +299,96 @@ class LocaSensor(LocaEntityMixin, CoordinatorEntity, SensorEntity):
             )
 
         # Add additional device information
-        for key, attr_name in [
-            ("signal_strength", "gsm_signal_strength"),
-            ("location_label", "location_label"),
-            ("address", "address"),
-        ]:
-            if value := self.device_data.get(key):
+        for key, attr_name in _ASSET_INFO_EXTRA:
+            if value := device_data.get(key):
                 attributes[attr_name] = value
         return attributes
 
-    def _get_speed_attributes(self) -> dict[str, Any]:
-        """Get attributes for speed sensor."""
+    @property
+    def icon(self) -> str | None:
+        """Return an icon matching the asset type."""
+        asset_type = self._device_data.get("asset_info", {}).get("type", 0)
+        return _ICON_GET(asset_type, "mdi:radar")
+
+
+class LocaSpeedSensor(LocaSensor):
+    """Speed of a Loca device."""
+
+    _sensor_type = "speed"
+
+    @property
+    def native_value(self) -> Any:
+        """Return the speed."""
+        return self._device_data.get("speed")
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the device snapshot."""
+        device_data = self._device_data
         attributes = {}
-        if location_source := self.device_data.get("location_source"):
+        if location_source := device_data.get("location_source"):
             attributes["location_source"] = location_source
-        if satellites := self.device_data.get("satellites"):
+        if satellites := device_data.get("satellites"):
             attributes["satellites"] = satellites
-        if gps_accuracy := self.device_data.get("gps_accuracy"):
-            attributes["gps_accuracy"] = f"{gps_accuracy}m"
+        if gps_accuracy := device_data.get("gps_accuracy"):
+            attributes["gps_accuracy"] = _format_accuracy(gps_accuracy)
         return attributes
 
-    def _format_time_of_day(self, timeofday: int | float) -> str | None:
-        """Format timeofday value to HH:MM format."""
-        try:
-            timeofday = int(timeofday)
-            if timeofday >= 1000:
-                # Extract hours and minutes from HHMM00 format (e.g., 91000 = 9:10)
-                hours = timeofday // 10000 if timeofday >= 10000 else 0
-                minutes = (timeofday % 10000) // 100 if timeofday >= 100 else 0
-            else:
-                # Fallback: treat as seconds since midnight
-                timeofday = abs(timeofday) % TimeConstants.SECONDS_PER_DAY
-                hours = (
-                    timeofday // TimeConstants.SECONDS_PER_HOUR
-                    if timeofday >= TimeConstants.SECONDS_PER_HOUR
-                    else 0
-                )
-                minutes = (
-                    (timeofday % TimeConstants.SECONDS_PER_HOUR)
-                    // TimeConstants.SECONDS_PER_MINUTE
-                    if timeofday >= TimeConstants.SECONDS_PER_MINUTE
-                    else 0
-                )
-
-            # Ensure valid time range using constants
-            hours = min(TimeConstants.HOURS_PER_DAY - 1, max(0, hours))
-            minutes = min(TimeConstants.MINUTES_PER_HOUR - 1, max(0, minutes))
-            return f"{hours:02d}:{minutes:02d}"
-        except ValueError, TypeError:
-            return None
-
-    def _get_location_update_attributes(self) -> dict[str, Any]:
-        """Get attributes for location_update sensor."""
+
+class LocaLocationUpdateSensor(LocaSensor):
+    """Location-update schedule of a Loca device."""
+
+    _sensor_type = "location_update"
+
+    @property
+    def native_value(self) -> str:
+        """Summarise location-update configuration."""
+        location_update = self._device_data.get("location_update", {})
+        if not location_update:
+            return "Not configured"
+        return "Always on" if location_update.get("always", 0) == 1 else "Scheduled"
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the device snapshot."""
         attributes: dict[str, Any] = {}
-        location_update = self.device_data.get("location_update", {})
+        location_update = self._device_data.get("location_update", {})
         if not location_update:
             return attributes
 
         # Add formatted update time
-        if timeofday := location_update.get("timeofday"):
-            if isinstance(timeofday, (int, float)):
-                if formatted_time := self._format_time_of_day(timeofday):
-                    attributes["update_time"] = formatted_time
+        timeofday = location_update.get("timeofday")
+        if timeofday and isinstance(timeofday, (int, float)) and isfinite(timeofday):
+            attributes["update_time"] = _format_time_of_day(timeofday)
 
+        frequency = location_update.get("frequency", 0)
         attributes.update(
             {
-                "frequency": location_update.get("frequency", 0),
+                "frequency": frequency,
                 "always_on": location_update.get("always", 0) == 1,
                 "begin_time": location_update.get("begin", 0),
                 "end_time": location_update.get("end", 0),
             }
         )
 
-        # Convert frequency to human readable format using constants
-        frequency = location_update.get("frequency", 0)
-        if frequency >= TimeConstants.SECONDS_PER_DAY:
-            attributes["frequency_description"] = (
-                f"{frequency // TimeConstants.SECONDS_PER_DAY} day(s)"
-            )
-        elif frequency >= TimeConstants.SECONDS_PER_HOUR:
-            attributes["frequency_description"] = (
-                f"{frequency // TimeConstants.SECONDS_PER_HOUR} hour(s)"
-            )
-        elif frequency >= TimeConstants.SECONDS_PER_MINUTE:
-            attributes["frequency_description"] = (
-                f"{frequency // TimeConstants.SECONDS_PER_MINUTE} minute(s)"
-            )
-        else:
-            attributes["frequency_description"] = f"{frequency} second(s)"
+        # Convert frequency to human readable format
+        attributes["frequency_description"] = _format_frequency(frequency)
         return attributes
 
-    def _get_location_attributes(self) -> dict[str, Any]:
-        """Get attributes for location sensor."""
+
+class LocaLocationSensor(LocaSensor):
+    """Street address of a Loca device."""
+
+    _sensor_type = "location"
+
+    @property
+    def native_value(self) -> str:
+        """Return the formatted address or the unknown-location fallback."""
+        return self._device_data.get("address") or "Unknown location"
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the device snapshot."""
+        device_data = self._device_data
         attributes = {}
-        address_details = self.device_data.get("address_details", {})
+        address_details = device_data.get("address_details", {})
 
         # Add non-empty address components
         for key, value in address_details.items():
@@ -287,56 +396,22 @@ class LocaSensor(LocaEntityMixin, CoordinatorEntity, SensorEntity):
                 attributes[key] = value
 
         # Add contextual information
-        for key, attr_name in [
-            ("location_label", "location_label"),
-            ("address", "full_address"),
-            ("satellites", "satellites"),
-        ]:
-            if value := self.device_data.get(key):
+        for key, attr_name in _LOCATION_EXTRA:
+            if value := device_data.get(key):
                 attributes[attr_name] = value
         return attributes
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attribute_handlers = {
-            "last_seen": self._get_last_seen_attributes,
-            "asset_info": self._get_asset_info_attributes,
-            "speed": self._get_speed_attributes,
-            "location_update": self._get_location_update_attributes,
-            "location": self._get_location_attributes,
-        }
-
-        handler = attribute_handlers.get(self._sensor_type)
-        return handler() if handler else {}
-
-    @property
-    def icon(self) -> str | None:
-        """Return the icon for the sensor."""
-        # For asset_info sensor, use dynamic icon based on asset type
-        if self._sensor_type == "asset_info":
-            asset_info = self.device_data.get("asset_info", {})
-            asset_type = asset_info.get("type", 0)
-            return LOCA_ASSET_TYPE_ICONS.get(asset_type, "mdi:radar")
-
-        # For other sensors, use the default icon from entity description
-        return self.entity_description.icon
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return super().available and self._device_id in self.coordinator.data
-
 
-# Dispatch table mapping sensor_type → resolver returning the entity's native_value.
-# Simple lookups use `dict.get`; sensor types with composition logic delegate to
-# dedicated `_native_value_*` methods on the entity.
-_NATIVE_VALUE_RESOLVERS: dict[str, Any] = {
-    "battery": lambda self: self.device_data.get("battery_level"),
-    "last_seen": lambda self: self.device_data.get("last_seen"),
-    "location_accuracy": lambda self: self.device_data.get("gps_accuracy"),
-    "speed": lambda self: self.device_data.get("speed"),
-    "asset_info": LocaSensor._native_value_asset_info,
-    "location_update": LocaSensor._native_value_location_update,
-    "location": LocaSensor._native_value_location,
+# Sensor class per SENSOR_TYPES key, used by async_setup_entry.
+_SENSOR_CLASSES: dict[str, type[LocaSensor]] = {
+    cls._sensor_type: cls
+    for cls in (
+        LocaBatterySensor,
+        LocaLastSeenSensor,
+        LocaLocationAccuracySensor,
+        LocaAssetInfoSensor,
+        LocaSpeedSensor,
+        LocaLocationUpdateSensor,
+        LocaLocationSensor,
+    )
 }
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import logging
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.service import async_extract_config_entry_ids
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 import voluptuous as vol
 
 from .const import DOMAIN
+from .coordinator import LocaDataUpdateCoordinator
 from .error_handling import LocaAPIUnavailableError
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,20 +27,56 @@ SERVICE_RATE_LIMIT_SECONDS = 5
 
 SERVICE_REFRESH_DEVICES = "refresh_devices"
 SERVICE_FORCE_UPDATE = "force_update"
+_SERVICES = (SERVICE_REFRESH_DEVICES, SERVICE_FORCE_UPDATE)
 
+# The _LocaServices instance whose handlers are registered
+_SERVICES_KEY: HassKey[_LocaServices] = HassKey(f"{DOMAIN}_services")
+
+# Non-empty strings are enforced by the schemas, before the handlers run
 SERVICE_REFRESH_DEVICES_SCHEMA = vol.Schema(
     {
-        vol.Optional("config_entry_id"): str,
-    }
+        vol.Optional("config_entry_id"): vol.All(cv.string, vol.Length(min=1)),
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
 SERVICE_FORCE_UPDATE_SCHEMA = vol.Schema(
     {
-        vol.Required("device_id"): cv.string,
-    }
+        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=1)),
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
 
+def _entry_coordinator(
+    entry: ConfigEntry | None,
+) -> LocaDataUpdateCoordinator | None:
+    """Return the coordinator of a set-up Loca entry, or None.
+
+    Entries that failed or have not finished setup carry no runtime_data.
+    """
+    return getattr(entry, "runtime_data", None)
+
+
+async def _async_refresh_coordinator(
+    coordinator: LocaDataUpdateCoordinator,
+) -> Exception | None:
+    """Refresh `coordinator` now and return the error of a failed update, or None.
+
+    The coordinator does not raise when its update fails; it records the
+    outcome in last_update_success and last_exception instead. async_refresh is
+    not debounced, so those describe this refresh. A failure caused by an
+    unavailable Loca API is raised rather than returned.
+    """
+    await coordinator.async_refresh()
+    if coordinator.last_update_success:
+        return None
+    err = coordinator.last_exception or UpdateFailed("Update failed")
+    if isinstance(err.__cause__, LocaAPIUnavailableError):
+        raise err.__cause__
+    return err
+
+
 class _LocaServices:
     """Service handlers with shared rate-limit state.
 
@@ -48,6 +88,8 @@ class _LocaServices:
         self._hass = hass
         self._last_refresh: dict[str, datetime] = {}
         self._last_force_update: dict[str, datetime] = {}
+        # device_id -> entry_id of the config entry whose coordinator tracks it
+        self._device_index: dict[str, str] = {}
 
     def _check_rate_limit(
         self,
@@ -95,36 +137,74 @@ class _LocaServices:
         except UpdateFailed as err:
             _LOGGER.error("Failed to refresh devices: %s", err)
             raise HomeAssistantError(f"Failed to refresh devices: {err}") from err
-        except Exception as err:
-            _LOGGER.exception("Unexpected error refreshing devices: %s", err)
+        except (ValueError, TypeError, KeyError, OSError) as err:
+            _LOGGER.error("Unexpected error refreshing devices: %s", err)
             raise HomeAssistantError(
                 f"Unexpected error refreshing devices: {err}"
             ) from err
 
     async def _refresh_entries(self, config_entry_ids: set[str]) -> int:
-        """Request a refresh on every Loca config entry in `config_entry_ids`."""
-        now = dt_util.utcnow()
-        refreshed_count = 0
+        """Concurrently refresh every Loca config entry in `config_entry_ids`.
+
+        All ids are validated before any refresh starts. Individual failures are
+        logged; if every refresh fails, the first error is raised. An unavailable
+        Loca API affects every entry, so it cancels the remaining refreshes and
+        is raised straight away.
+        """
+        coordinators: dict[str, LocaDataUpdateCoordinator] = {}
         for config_entry_id in config_entry_ids:
             config_entry = self._hass.config_entries.async_get_entry(config_entry_id)
             if not config_entry or config_entry.domain != DOMAIN:
                 raise ServiceValidationError(
                     f"Config entry {config_entry_id} not found or not a Loca entry"
                 )
-            coordinator = config_entry.runtime_data
-            await coordinator.async_request_refresh()
-            self._last_refresh[config_entry_id] = now
-            refreshed_count += 1
-            _LOGGER.info("Refreshed devices for config entry: %s", config_entry_id)
-        return refreshed_count
+            if (coordinator := _entry_coordinator(config_entry)) is None:
+                raise ServiceValidationError(
+                    f"Config entry {config_entry_id} is not loaded"
+                )
+            coordinators[config_entry_id] = coordinator
+
+        failures: list[Exception] = []
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for config_entry_id, coordinator in coordinators.items():
+                    task_group.create_task(
+                        self._refresh_entry(config_entry_id, coordinator, failures)
+                    )
+        except ExceptionGroup as err_group:
+            # Surface a single error to the service handler, preferring an outage
+            unavailable = err_group.subgroup(LocaAPIUnavailableError)
+            raise (unavailable or err_group).exceptions[0] from None
+
+        if failures and len(failures) == len(coordinators):
+            raise failures[0]
+        return len(coordinators) - len(failures)
+
+    async def _refresh_entry(
+        self,
+        config_entry_id: str,
+        coordinator: LocaDataUpdateCoordinator,
+        failures: list[Exception],
+    ) -> None:
+        """Refresh one config entry, recording a failed update in `failures`.
+
+        A failure caused by an unavailable Loca API is raised, cancelling the
+        other refreshes.
+        """
+        if (err := await _async_refresh_coordinator(coordinator)) is not None:
+            _LOGGER.warning(
+                "Failed to refresh config entry %s: %s", config_entry_id, err
+            )
+            failures.append(err)
+            return
+        self._last_refresh[config_entry_id] = dt_util.utcnow()
+        _LOGGER.info("Refreshed devices for config entry: %s", config_entry_id)
 
     async def async_force_update(self, call: ServiceCall) -> None:
         """Force update a specific device."""
         device_id: str | None = None
         try:
             device_id = call.data["device_id"]
-            if not device_id:
-                raise ServiceValidationError("Device ID is required")
 
             self._check_rate_limit(
                 device_id, self._last_force_update, "rate_limit_update"
@@ -145,8 +225,8 @@ class _LocaServices:
         except UpdateFailed as err:
             _LOGGER.error("Failed to force update device %s: %s", device_id, err)
             raise HomeAssistantError(f"Failed to force update device: {err}") from err
-        except Exception as err:
-            _LOGGER.exception(
+        except (ValueError, TypeError, KeyError, OSError) as err:
+            _LOGGER.error(
                 "Unexpected error force updating device %s: %s", device_id, err
             )
             raise HomeAssistantError(
@@ -154,40 +234,89 @@ class _LocaServices:
             ) from err
 
     async def _refresh_device(self, device_id: str) -> bool:
-        """Trigger a refresh on the coordinator tracking `device_id`. Returns True if found."""
-        for config_entry in self._hass.config_entries.async_entries(DOMAIN):
-            coordinator = config_entry.runtime_data
-            if coordinator.data and device_id in coordinator.data:
-                await coordinator.async_request_refresh()
-                self._last_force_update[device_id] = dt_util.utcnow()
-                _LOGGER.info("Forced update for device: %s", device_id)
-                return True
-        return False
+        """Refresh the coordinator tracking `device_id`. Returns True if found.
+
+        A failed update is raised, as LocaAPIUnavailableError when the Loca API
+        is unavailable.
+        """
+        coordinator = self._coordinator_for_device(device_id)
+        if coordinator is None:
+            return False
+        if (err := await _async_refresh_coordinator(coordinator)) is not None:
+            raise err
+        self._last_force_update[device_id] = dt_util.utcnow()
+        _LOGGER.info("Forced update for device: %s", device_id)
+        return True
+
+    def _coordinator_for_device(
+        self, device_id: str
+    ) -> LocaDataUpdateCoordinator | None:
+        """Return the coordinator tracking `device_id`, or None if no entry tracks it.
+
+        Served from the device index; the index is rebuilt from the Loca config
+        entries only when the indexed entry is gone or no longer has the device.
+        """
+        if (entry_id := self._device_index.get(device_id)) is not None:
+            entry = self._hass.config_entries.async_get_entry(entry_id)
+            coordinator = _entry_coordinator(entry)
+            if coordinator is not None and device_id in (coordinator.data or ()):
+                return coordinator
+
+        index: dict[str, tuple[str, LocaDataUpdateCoordinator]] = {}
+        for entry in self._hass.config_entries.async_entries(DOMAIN):
+            if (coordinator := _entry_coordinator(entry)) is None:
+                continue
+            for tracked_id in coordinator.data or ():
+                index.setdefault(tracked_id, (entry.entry_id, coordinator))
+        self._device_index = {
+            tracked_id: entry_id for tracked_id, (entry_id, _) in index.items()
+        }
+        if (found := index.get(device_id)) is None:
+            return None
+        return found[1]
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for Loca integration."""
-    services = _LocaServices(hass)
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REFRESH_DEVICES,
-        services.async_refresh_devices,
-        schema=SERVICE_REFRESH_DEVICES_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_FORCE_UPDATE,
-        services.async_force_update,
-        schema=SERVICE_FORCE_UPDATE_SCHEMA,
-    )
+    """Set up services for Loca integration.
+
+    All handlers are bound to the one _LocaServices instance stored in
+    hass.data, so their rate-limit and device-index state is never split.
+    Calling this again only re-registers services that have gone missing.
+    """
+    services = hass.data.get(_SERVICES_KEY)
+    if services is None:
+        services = hass.data[_SERVICES_KEY] = _LocaServices(hass)
+        missing = list(_SERVICES)
+    else:
+        missing = [
+            service
+            for service in _SERVICES
+            if not hass.services.has_service(DOMAIN, service)
+        ]
+    if not missing:
+        return
+
+    handlers = {
+        SERVICE_REFRESH_DEVICES: (
+            services.async_refresh_devices,
+            SERVICE_REFRESH_DEVICES_SCHEMA,
+        ),
+        SERVICE_FORCE_UPDATE: (
+            services.async_force_update,
+            SERVICE_FORCE_UPDATE_SCHEMA,
+        ),
+    }
+    for service in missing:
+        handler, schema = handlers[service]
+        hass.services.async_register(DOMAIN, service, handler, schema=schema)
 
     _LOGGER.info("Loca services registered")
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload Loca services."""
-    hass.services.async_remove(DOMAIN, SERVICE_REFRESH_DEVICES)
-    hass.services.async_remove(DOMAIN, SERVICE_FORCE_UPDATE)
+    hass.data.pop(_SERVICES_KEY, None)
+    for service in _SERVICES:
+        if hass.services.has_service(DOMAIN, service):
+            hass.services.async_remove(DOMAIN, service)
     _LOGGER.info("Loca services unloaded")
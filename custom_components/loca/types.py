@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal, Protocol, TypedDict
+from typing import Any, Final, Literal, Protocol, TypedDict
 
 # Literal types for better type safety
 LocationSource = Literal["GPS", "Cell Tower"]
@@ -134,3 +134,9 @@ class ErrorResult(TypedDict):
     """Type definition for error results."""
 
     base: Literal["cannot_connect", "invalid_auth", "unknown"]
+
+
+# Runtime counterpart of ErrorResult["base"], for membership checks
+ERROR_BASES: Final[frozenset[str]] = frozenset(
+    {"cannot_connect", "invalid_auth", "unknown"}
+)
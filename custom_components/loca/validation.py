@@ -10,6 +10,14 @@ from .types import LocationEntry, StatusEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coordinate bounds and GPS accuracy default, bound once for the per-device
+# validation hot path
+_LAT_MIN = LocationConstants.MIN_LATITUDE
+_LAT_MAX = LocationConstants.MAX_LATITUDE
+_LON_MIN = LocationConstants.MIN_LONGITUDE
+_LON_MAX = LocationConstants.MAX_LONGITUDE
+_DEFAULT_GPS_ACC = LocationConstants.DEFAULT_GPS_ACCURACY
+
 
 class ValidationError(Exception):
     """Exception raised for validation errors."""
@@ -29,18 +37,14 @@ class DataValidator:
                 f"Invalid coordinate values: {latitude}, {longitude}"
             ) from err
 
-        if not (
-            LocationConstants.MIN_LATITUDE <= lat <= LocationConstants.MAX_LATITUDE
-        ):
+        if not _LAT_MIN <= lat <= _LAT_MAX:
             raise ValidationError(
-                f"Latitude {lat} out of valid range ({LocationConstants.MIN_LATITUDE}, {LocationConstants.MAX_LATITUDE})"
+                f"Latitude {lat} out of valid range ({_LAT_MIN}, {_LAT_MAX})"
             )
 
-        if not (
-            LocationConstants.MIN_LONGITUDE <= lon <= LocationConstants.MAX_LONGITUDE
-        ):
+        if not _LON_MIN <= lon <= _LON_MAX:
             raise ValidationError(
-                f"Longitude {lon} out of valid range ({LocationConstants.MIN_LONGITUDE}, {LocationConstants.MAX_LONGITUDE})"
+                f"Longitude {lon} out of valid range ({_LON_MIN}, {_LON_MAX})"
             )
 
         return lat, lon
@@ -76,15 +80,11 @@ class DataValidator:
     def validate_gps_accuracy(accuracy: Any) -> int:
         """Validate GPS accuracy."""
         try:
-            acc = (
-                int(float(accuracy))
-                if accuracy is not None
-                else LocationConstants.DEFAULT_GPS_ACCURACY
-            )
+            acc = int(float(accuracy)) if accuracy is not None else _DEFAULT_GPS_ACC
             return max(1, acc)  # Ensure positive accuracy
         except ValueError, TypeError:
             _LOGGER.warning("Invalid GPS accuracy value: %s", accuracy)
-            return LocationConstants.DEFAULT_GPS_ACCURACY
+            return _DEFAULT_GPS_ACC
 
     @staticmethod
     def validate_status_entry(entry: dict[str, Any]) -> StatusEntry:
@@ -138,9 +138,7 @@ class DataValidator:
             "label": str(label),
             "latitude": lat,
             "longitude": lon,
-            "radius": max(
-                1, int(entry.get("radius", LocationConstants.DEFAULT_GPS_ACCURACY))
-            ),
+            "radius": max(1, int(entry.get("radius", _DEFAULT_GPS_ACC))),
             "street": str(entry.get("street", "")),
             "number": str(entry.get("number", "")),
             "city": str(entry.get("city", "")),
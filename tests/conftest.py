@@ -1,22 +1,79 @@
-"""Common fixtures for Loca tests."""
+"""Common fixtures for Loca tests.
+
+Fixtures handing out objects that tests mutate or attach state to (config
+entries, coordinators and their stubs) are function-scoped. Session-scoped
+fixtures are set up once per test process; under pytest-xdist every worker is a
+separate process with its own session.
+"""
 
 from __future__ import annotations
 
-from types import MappingProxyType
-from unittest.mock import MagicMock, patch
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import patch
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
 import pytest
 
 from custom_components.loca.const import CONF_API_KEY, DOMAIN
+from custom_components.loca.coordinator import LocaDataUpdateCoordinator
 
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+_LAST_SEEN_1 = datetime(2022, 1, 1, 0, 0, 0)
+_LAST_SEEN_2 = datetime(2022, 1, 1, 0, 1, 0)
+
+# Parsed device data for two devices, as the coordinator would hold it; shared
+# read-only by mock_coordinator_with_data.
+_DEV_1 = {
+    "device_id": "12345",
+    "name": "Test Device",
+    "latitude": 52.3676,
+    "longitude": 4.9041,
+    "battery_level": 85,
+    "gps_accuracy": 5,
+    "location_source": "GPS",
+    "last_seen": _LAST_SEEN_1,
+    "address": "Test Street 42, 1234AB Amsterdam, Netherlands",
+    "speed": 65.5,
+    "satellites": 8,
+    "asset_info": {
+        "type": 1,
+        "brand": "BMW",
+        "model": "X3",
+        "serial": "ABC123",
+        "group": 248,
+        "group_name": "Autos",
+    },
+}
+
+_DEV_2 = {
+    "device_id": "67890",
+    "name": "Second Device",
+    "latitude": 51.5074,
+    "longitude": -0.1278,
+    "battery_level": 42,
+    "gps_accuracy": 10,
+    "location_source": "Cell Tower",
+    "last_seen": _LAST_SEEN_2,
+}
+
+_MOCK_COORDINATOR_DATA = {"12345": _DEV_1, "67890": _DEV_2}
+
+
 @pytest.fixture(autouse=True)
-def auto_enable_custom_integrations(enable_custom_integrations):
-    """Enable custom integrations for tests."""
+def auto_enable_custom_integrations(request: pytest.FixtureRequest):
+    """Enable custom integrations for tests that run Home Assistant.
+
+    enable_custom_integrations pulls in the hass fixture, so it is only
+    requested by tests that already use hass; pure unit tests skip it.
+    """
+    if "hass" in request.fixturenames:
+        request.getfixturevalue("enable_custom_integrations")
     yield
 
 
@@ -32,136 +89,68 @@ def expected_lingering_timers():
     return True
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def mock_persistent_notification():
-    """Mock persistent notification to avoid warnings in tests."""
+    """Mock persistent notification to avoid warnings in tests.
+
+    The patch target never changes, so it is applied once per session. The mock
+    is shared by every test in the session and keeps its call history, so a
+    test asserting notifications must patch persistent_notification itself.
+    """
     with patch("homeassistant.components.persistent_notification"):
         yield
 
 
-@pytest.fixture
-def mock_config_entry():
-    """Return a mock config entry."""
-    return ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="Test Loca",
-        data={
+# Constructor arguments for mock_config_entry, built once. The entry itself is
+# created per test because tests attach runtime_data and add it to hass.
+_CONFIG_ENTRY_KWARGS: dict[str, Any] = {
+    "version": 1,
+    "minor_version": 1,
+    "domain": DOMAIN,
+    "title": "Test Loca",
+    "data": MappingProxyType(
+        {
             CONF_API_KEY: "test_api_key",
             CONF_USERNAME: "test_user",
             CONF_PASSWORD: "test_password",
-        },
-        options={},
-        source="user",
-        entry_id="test_entry_id",
-        discovery_keys=MappingProxyType({}),
-        unique_id="test_user",
-        subentries_data=frozenset(),  # Required in newer HA versions
-    )
+        }
+    ),
+    "options": MappingProxyType({}),
+    "source": "user",
+    "entry_id": "test_entry_id",
+    "discovery_keys": MappingProxyType({}),
+    "unique_id": "test_user",
+    "subentries_data": frozenset(),  # Required in newer HA versions
+}
 
 
 @pytest.fixture
-def mock_api_data():
-    """Return mock API data."""
-    return {
-        "status": "ok",
-        "assets": [
-            {
-                "id": "12345",
-                "name": "Test Device",
-                "battery": 85,
-                "lastlocation": {
-                    "lat": 52.3676,
-                    "lng": 4.9041,
-                    "time": 1640995200,  # 2022-01-01 00:00:00
-                    "accuracy": 5,
-                    "origin": 1,
-                },
-            },
-            {
-                "id": "67890",
-                "name": "Second Device",
-                "battery": 42,
-                "lastlocation": {
-                    "lat": 51.5074,
-                    "lng": -0.1278,
-                    "time": 1640995260,  # 2022-01-01 00:01:00
-                    "accuracy": 10,
-                    "origin": 2,
-                },
-            },
-        ],
-    }
+def mock_config_entry():
+    """Return a mock config entry."""
+    return ConfigEntry(**_CONFIG_ENTRY_KWARGS)
 
 
 @pytest.fixture
-def mock_empty_response():
-    """Return mock empty API response."""
-    return {
-        "status": "ok",
-        "assets": [],
-    }
+def coordinator(hass: HomeAssistant, mock_config_entry):
+    """Return a coordinator for the mock config entry.
 
-
-@pytest.fixture
-def mock_error_response():
-    """Return mock error API response."""
-    return {
-        "status": "error",
-        "message": "Authentication failed",
-    }
+    Function-scoped like hass; tests are free to stub its API client.
+    """
+    return LocaDataUpdateCoordinator(hass, mock_config_entry)
 
 
 @pytest.fixture
 def mock_coordinator():
-    """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.data = {}
-    coordinator.last_update_success = True
-    coordinator.last_exception = None
-    return coordinator
+    """Create a stub coordinator exposing only its state attributes.
+
+    Tests that need coordinator methods (refresh, listeners) build a MagicMock.
+    """
+    return SimpleNamespace(data={}, last_update_success=True, last_exception=None)
 
 
 @pytest.fixture
 def mock_coordinator_with_data():
-    """Create a mock coordinator with data."""
-    from datetime import datetime
-
-    coordinator = MagicMock()
-    coordinator.data = {
-        "12345": {
-            "device_id": "12345",
-            "name": "Test Device",
-            "latitude": 52.3676,
-            "longitude": 4.9041,
-            "battery_level": 85,
-            "gps_accuracy": 5,
-            "location_source": "GPS",
-            "last_seen": datetime(2022, 1, 1, 0, 0, 0),
-            "address": "Test Street 42, 1234AB Amsterdam, Netherlands",
-            "speed": 65.5,
-            "satellites": 8,
-            "asset_info": {
-                "type": 1,
-                "brand": "BMW",
-                "model": "X3",
-                "serial": "ABC123",
-                "group": 248,
-                "group_name": "Autos",
-            },
-        },
-        "67890": {
-            "device_id": "67890",
-            "name": "Second Device",
-            "latitude": 51.5074,
-            "longitude": -0.1278,
-            "battery_level": 42,
-            "gps_accuracy": 10,
-            "location_source": "Cell Tower",
-            "last_seen": datetime(2022, 1, 1, 0, 1, 0),
-        },
-    }
-    coordinator.last_update_success = True
-    coordinator.last_exception = None
-    return coordinator
+    """Create a stub coordinator with data."""
+    return SimpleNamespace(
+        data=_MOCK_COORDINATOR_DATA, last_update_success=True, last_exception=None
+    )
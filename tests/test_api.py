@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Coroutine
 from datetime import datetime
+import json
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +17,155 @@ import pytest
 from custom_components.loca.api import LocaAPI
 
 
+def async_return(value: Any) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Return a coroutine function resolving to `value`, lighter than AsyncMock."""
+
+    async def _coro(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _coro
+
+
+class _FakeResponseContext:
+    """Async context manager yielding a canned response."""
+
+    def __init__(self, resp: MagicMock) -> None:
+        self._resp = resp
+
+    async def __aenter__(self) -> MagicMock:
+        return self._resp
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+class _FakeSession:
+    """Minimal stand-in for ClientSession answering every request alike.
+
+    Plain methods instead of a specced mock, so no ClientSession introspection
+    or call recording happens per request.
+    """
+
+    def __init__(self, resp: MagicMock) -> None:
+        self._resp = resp
+
+    def get(self, *args: Any, **kwargs: Any) -> _FakeResponseContext:
+        return _FakeResponseContext(self._resp)
+
+    def post(self, *args: Any, **kwargs: Any) -> _FakeResponseContext:
+        return _FakeResponseContext(self._resp)
+
+    async def close(self) -> None:
+        return None
+
+
+# parse_status_as_device cases: raw StatusList entry and expected device fields
+_PARSE_STATUS_CASES: list[dict[str, Any]] = json.loads(
+    (Path(__file__).parent / "testdata" / "parse_status_cases.json").read_text(
+        encoding="utf-8"
+    )
+)
+
+MockSessionFactory = Callable[..., tuple[_FakeSession, MagicMock]]
+
+# Payloads are never mutated by the code under test, so they are built once
+# and shared by every test in the session.
+_MOCK_AUTH_RESPONSE: dict[str, Any] = {
+    "user": {
+        "userid": 1,
+        "id": 1,
+        "username": "test_user",
+        "email": "test@example.com",
+    }
+}
+
+_MOCK_ASSETS_RESPONSE: dict[str, Any] = {
+    "status": "ok",
+    "assets": [
+        {
+            "id": "12345",
+            "name": "Test Device",
+            "battery": 85,
+            "lastlocation": {
+                "lat": 52.3676,
+                "lng": 4.9041,
+                "time": 1640995200,
+                "accuracy": 5,
+                "origin": 1,
+            },
+        },
+        {
+            "id": "67890",
+            "name": "Second Device",
+            "battery": 42,
+            "lastlocation": {
+                "lat": 51.5074,
+                "lng": -0.1278,
+                "time": 1640995260,
+                "accuracy": 10,
+                "origin": 2,
+            },
+        },
+    ],
+}
+
+_MOCK_STATUS_LIST_RESPONSE: list[dict[str, Any]] = [
+    {
+        "Asset": {
+            "id": "12345",
+            "label": "Test Device",
+            "type": 1,
+            "brand": "BMW",
+            "model": "X3",
+            "serial": "ABC123",
+        },
+        "History": {
+            "latitude": 52.3676,
+            "longitude": 4.9041,
+            "time": 1640995200,
+            "charge": 85,
+            "HDOP": 5,
+            "SATU": 8,
+            "speed": 65.5,
+            "strength": 75,
+        },
+        "Spot": {
+            "street": "Test Street",
+            "number": "42",
+            "city": "Amsterdam",
+            "zipcode": "1234AB",
+            "country": "Netherlands",
+            "origin": 1,
+        },
+    }
+]
+
+_MOCK_GROUPS_RESPONSE: dict[str, Any] = {
+    "groups": [
+        {"id": 248, "label": "Autos", "account": 2},
+        {"id": 276, "label": "Motoren", "account": 2},
+    ]
+}
+
+_MOCK_LOCATIONS_RESPONSE: list[dict[str, Any]] = [
+    {
+        "id": "1",
+        "insert": "2022-02-06 09:43:21",
+        "update": "2022-04-26 19:35:06",
+        "label": "Home",
+        "latitude": "51.876682",
+        "longitude": "4.615142",
+        "number": "30",
+        "street": "Brouwerstraat",
+        "city": "Ridderkerk",
+        "state": "Zuid-Holland",
+        "zipcode": "2984AR",
+        "country": "Netherlands",
+        "radius": "100",
+    }
+]
+
+
 @pytest.fixture
 def api() -> LocaAPI:
     """Create a test API instance."""
@@ -37,118 +189,60 @@ def mock_session() -> MagicMock:
 
 
 @pytest.fixture
-def mock_auth_response() -> dict[str, Any]:
-    """Mock successful authentication response."""
-    return {
-        "user": {
-            "userid": 1,
-            "id": 1,
-            "username": "test_user",
-            "email": "test@example.com",
-        }
-    }
+def api_with_groups(api: LocaAPI) -> LocaAPI:
+    """Return the test API instance with a pre-filled groups cache."""
+    api._groups_cache = {248: "Autos", 276: "Motoren"}
+    return api
 
 
 @pytest.fixture
-def mock_assets_response() -> dict[str, Any]:
-    """Mock successful assets response."""
-    return {
-        "status": "ok",
-        "assets": [
-            {
-                "id": "12345",
-                "name": "Test Device",
-                "battery": 85,
-                "lastlocation": {
-                    "lat": 52.3676,
-                    "lng": 4.9041,
-                    "time": 1640995200,
-                    "accuracy": 5,
-                    "origin": 1,
-                },
-            },
-            {
-                "id": "67890",
-                "name": "Second Device",
-                "battery": 42,
-                "lastlocation": {
-                    "lat": 51.5074,
-                    "lng": -0.1278,
-                    "time": 1640995260,
-                    "accuracy": 10,
-                    "origin": 2,
-                },
-            },
-        ],
-    }
+def make_mock_session() -> MockSessionFactory:
+    """Return a factory for a fake session answering every request alike."""
+
+    def _make(
+        json_payload: Any = None, status: int = 200, text: str = ""
+    ) -> tuple[_FakeSession, MagicMock]:
+        resp = MagicMock()
+        resp.status = status
+        resp.json = async_return(json_payload)
+        resp.text = async_return(text)
+        return _FakeSession(resp), resp
+
+    return _make
 
 
 @pytest.fixture
+def patched_session(
+    api: LocaAPI,
+    monkeypatch: pytest.MonkeyPatch,
+    make_mock_session: MockSessionFactory,
+) -> MockSessionFactory:
+    """Return a factory that makes `api` use a fake session for this test."""
+
+    def _patch(*args: Any, **kwargs: Any) -> tuple[_FakeSession, MagicMock]:
+        session, resp = make_mock_session(*args, **kwargs)
+        monkeypatch.setattr(api, "_get_session", AsyncMock(return_value=session))
+        return session, resp
+
+    return _patch
+
+
+@pytest.fixture(scope="session")
 def mock_status_list_response() -> list[dict[str, Any]]:
     """Mock successful StatusList response."""
-    return [
-        {
-            "Asset": {
-                "id": "12345",
-                "label": "Test Device",
-                "type": 1,
-                "brand": "BMW",
-                "model": "X3",
-                "serial": "ABC123",
-            },
-            "History": {
-                "latitude": 52.3676,
-                "longitude": 4.9041,
-                "time": 1640995200,
-                "charge": 85,
-                "HDOP": 5,
-                "SATU": 8,
-                "speed": 65.5,
-                "strength": 75,
-            },
-            "Spot": {
-                "street": "Test Street",
-                "number": "42",
-                "city": "Amsterdam",
-                "zipcode": "1234AB",
-                "country": "Netherlands",
-                "origin": 1,
-            },
-        }
-    ]
+    return _MOCK_STATUS_LIST_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_groups_response() -> dict[str, Any]:
     """Mock successful groups response."""
-    return {
-        "groups": [
-            {"id": 248, "label": "Autos", "account": 2},
-            {"id": 276, "label": "Motoren", "account": 2},
-        ]
-    }
+    return _MOCK_GROUPS_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_locations_response() -> list[dict[str, Any]]:
     """Mock successful locations response."""
-    return [
-        {
-            "id": "1",
-            "insert": "2022-02-06 09:43:21",
-            "update": "2022-04-26 19:35:06",
-            "label": "Home",
-            "latitude": "51.876682",
-            "longitude": "4.615142",
-            "number": "30",
-            "street": "Brouwerstraat",
-            "city": "Ridderkerk",
-            "state": "Zuid-Holland",
-            "zipcode": "2984AR",
-            "country": "Netherlands",
-            "radius": "100",
-        }
-    ]
+    return _MOCK_LOCATIONS_RESPONSE
 
 
 class TestLocaAPIInitialization:
@@ -242,64 +336,31 @@ class TestAuthentication:
     """Test authentication functionality."""
 
     @pytest.mark.asyncio
-    async def test_authenticate_success(
-        self, api: LocaAPI, mock_auth_response: dict
+    @pytest.mark.parametrize(
+        ("status", "payload", "expected"),
+        [
+            pytest.param(200, _MOCK_AUTH_RESPONSE, True, id="success"),
+            pytest.param(
+                200, {"error": "Invalid credentials"}, False, id="no_user_object"
+            ),
+            pytest.param(401, None, False, id="http_error"),
+        ],
+    )
+    async def test_authenticate(
+        self,
+        api: LocaAPI,
+        patched_session: MockSessionFactory,
+        status: int,
+        payload: dict[str, Any] | None,
+        expected: bool,
     ) -> None:
-        """Test successful authentication."""
-        mock_session = AsyncMock(spec=ClientSession)
-
-        # Mock connectivity test
-        mock_test_resp = MagicMock()
-        mock_test_resp.status = 200
-
-        # Mock auth response
-        mock_auth_resp = MagicMock()
-        mock_auth_resp.status = 200
-        mock_auth_resp.json = AsyncMock(return_value=mock_auth_response)
-
-        mock_session.get.return_value.__aenter__.return_value = mock_test_resp
-        mock_session.post.return_value.__aenter__.return_value = mock_auth_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.authenticate()
-
-            assert result is True
-            assert api._authenticated is True
-
-    @pytest.mark.asyncio
-    async def test_authenticate_no_user_object(self, api: LocaAPI) -> None:
-        """Test authentication failure with no user object."""
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"error": "Invalid credentials"})
-
-        mock_session.get.return_value.__aenter__.return_value = mock_resp
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.authenticate()
-
-            assert result is False
-            assert api._authenticated is False
-
-    @pytest.mark.asyncio
-    async def test_authenticate_http_error(self, api: LocaAPI) -> None:
-        """Test authentication with HTTP error."""
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 401
-        mock_resp.text = AsyncMock(return_value="Unauthorized")
-
-        mock_session.get.return_value.__aenter__.return_value = mock_resp
+        """Test the authentication outcome for each login response."""
+        patched_session(payload, status=status, text="Unauthorized")
 
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.authenticate()
+        result = await api.authenticate()
 
-            assert result is False
-            assert api._authenticated is False
+        assert result is expected
+        assert api._authenticated is expected
 
     @pytest.mark.asyncio
     async def test_authenticate_exception(self, api: LocaAPI) -> None:
@@ -314,22 +375,17 @@ class TestAuthentication:
             assert api._authenticated is False
 
     @pytest.mark.asyncio
-    async def test_logout_success(self, api: LocaAPI) -> None:
+    async def test_logout_success(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test successful logout."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session({"status": "ok"})
 
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"status": "ok"})
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.logout()
+        result = await api.logout()
 
-            assert result is True
-            assert api._authenticated is False
+        assert result is True
+        assert api._authenticated is False
 
     @pytest.mark.asyncio
     async def test_logout_not_authenticated(self, api: LocaAPI) -> None:
@@ -346,25 +402,29 @@ class TestAssetManagement:
     """Test asset management functionality."""
 
     @pytest.mark.asyncio
-    async def test_get_assets_success(
-        self, api: LocaAPI, mock_assets_response: dict
+    @pytest.mark.parametrize(
+        ("payload", "expected_ids"),
+        [
+            pytest.param(_MOCK_ASSETS_RESPONSE, ["12345", "67890"], id="success"),
+            pytest.param(
+                {"status": "error", "message": "Failed"}, [], id="error_response"
+            ),
+        ],
+    )
+    async def test_get_assets(
+        self,
+        api: LocaAPI,
+        patched_session: MockSessionFactory,
+        payload: dict[str, Any],
+        expected_ids: list[str],
     ) -> None:
-        """Test successful asset retrieval."""
+        """Test asset retrieval for successful and error responses."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session(payload)
 
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value=mock_assets_response)
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
+        result = await api.get_assets()
 
-            assert len(result) == 2
-            assert result[0]["id"] == "12345"
-            assert result[1]["id"] == "67890"
+        assert [asset["id"] for asset in result] == expected_ids
 
     @pytest.mark.asyncio
     async def test_get_assets_not_authenticated(self, api: LocaAPI) -> None:
@@ -376,109 +436,36 @@ class TestAssetManagement:
 
             assert result == []
 
-    @pytest.mark.asyncio
-    async def test_get_assets_error_response(self, api: LocaAPI) -> None:
-        """Test asset retrieval with error response."""
-        api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(
-            return_value={"status": "error", "message": "Failed"}
-        )
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
-
-            assert result == []
-
     @pytest.mark.asyncio
     async def test_get_status_list_success(
-        self, api: LocaAPI, mock_status_list_response: list
+        self,
+        api: LocaAPI,
+        patched_session: MockSessionFactory,
+        mock_status_list_response: list,
     ) -> None:
         """Test successful StatusList retrieval."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session(mock_status_list_response)
 
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value=mock_status_list_response)
+        result = await api.get_status_list()
 
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_status_list()
-
-            assert len(result) == 1
-            assert result[0]["Asset"]["id"] == "12345"
-            assert result[0]["Asset"]["label"] == "Test Device"
+        assert len(result) == 1
+        assert result[0]["Asset"]["id"] == "12345"
+        assert result[0]["Asset"]["label"] == "Test Device"
 
 
 class TestDataParsing:
     """Test data parsing functionality."""
 
-    def test_parse_status_as_device_complete(self, api: LocaAPI) -> None:
-        """Test parsing complete status data."""
-        status = {
-            "Asset": {
-                "id": "12345",
-                "label": "Test Device",
-                "type": 1,
-                "brand": "BMW",
-                "model": "X3",
-            },
-            "History": {
-                "latitude": 52.3676,
-                "longitude": 4.9041,
-                "time": 1640995200,
-                "charge": 85,
-                "HDOP": 5,
-                "SATU": 8,
-                "speed": 65.5,
-                "strength": 75,
-            },
-            "Spot": {
-                "street": "Test Street",
-                "number": "42",
-                "city": "Amsterdam",
-                "zipcode": "1234AB",
-                "country": "Netherlands",
-                "origin": 1,
-            },
-        }
-
-        result = api.parse_status_as_device(status)
-
-        assert result["device_id"] == "12345"
-        assert result["name"] == "Test Device"
-        assert result["latitude"] == 52.3676
-        assert result["longitude"] == 4.9041
-        assert result["battery_level"] == 85
-        assert result["gps_accuracy"] == 5
-        assert result["address"] == "Test Street 42, 1234AB Amsterdam, Netherlands"
-        assert result["speed"] == 65.5
-        assert result["satellites"] == 8
-        assert result["asset_info"]["type"] == 1
-
-    def test_parse_status_as_device_minimal(self, api: LocaAPI) -> None:
-        """Test parsing minimal status data."""
-        status = {
-            "Asset": {"id": "67890"},
-            "History": {"latitude": 51.5074, "longitude": -0.1278},
-        }
-
-        result = api.parse_status_as_device(status)
+    @pytest.mark.parametrize(
+        "case", _PARSE_STATUS_CASES, ids=[case["id"] for case in _PARSE_STATUS_CASES]
+    )
+    def test_parse_status_as_device(self, api: LocaAPI, case: dict[str, Any]) -> None:
+        """Test parsing status data against the expected device fields."""
+        expected = case["expected"]
+        result = api.parse_status_as_device(case["input"])
 
-        assert result["device_id"] == "67890"
-        assert result["name"] == "Loca Device 67890"
-        assert result["latitude"] == 51.5074
-        assert result["longitude"] == -0.1278
-        assert result["battery_level"] is None
-        assert result["gps_accuracy"] == 1  # Default HDOP value
-        assert result["address"] is None
+        assert {key: result[key] for key in expected} == expected
 
     def test_parse_location_as_device_complete(self, api: LocaAPI) -> None:
         """Test parsing complete location data."""
@@ -513,24 +500,20 @@ class TestGroupManagement:
 
     @pytest.mark.asyncio
     async def test_get_groups_success(
-        self, api: LocaAPI, mock_groups_response: dict
+        self,
+        api: LocaAPI,
+        patched_session: MockSessionFactory,
+        mock_groups_response: dict,
     ) -> None:
         """Test successful groups retrieval."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value=mock_groups_response)
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
+        patched_session(mock_groups_response)
 
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_groups()
+        result = await api.get_groups()
 
-            assert len(result) == 2
-            assert result[0]["id"] == 248
-            assert result[0]["label"] == "Autos"
+        assert len(result) == 2
+        assert result[0]["id"] == 248
+        assert result[0]["label"] == "Autos"
 
     @pytest.mark.asyncio
     async def test_update_groups_cache(self, api: LocaAPI) -> None:
@@ -548,14 +531,12 @@ class TestGroupManagement:
             assert api._groups_cache[276] == "Motoren"
             assert api._groups_cache[300] == ""
 
-    def test_get_group_name(self, api: LocaAPI) -> None:
+    def test_get_group_name(self, api_with_groups: LocaAPI) -> None:
         """Test getting group name from cache."""
-        api._groups_cache = {248: "Autos", 276: "Motoren"}
-
-        assert api.get_group_name(248) == "Autos"
-        assert api.get_group_name(276) == "Motoren"
-        assert api.get_group_name(999) == ""
-        assert api.get_group_name(None) == ""
+        assert api_with_groups.get_group_name(248) == "Autos"
+        assert api_with_groups.get_group_name(276) == "Motoren"
+        assert api_with_groups.get_group_name(999) == ""
+        assert api_with_groups.get_group_name(None) == ""
 
 
 class TestLocationManagement:
@@ -563,24 +544,20 @@ class TestLocationManagement:
 
     @pytest.mark.asyncio
     async def test_get_user_locations_success(
-        self, api: LocaAPI, mock_locations_response: list
+        self,
+        api: LocaAPI,
+        patched_session: MockSessionFactory,
+        mock_locations_response: list,
     ) -> None:
         """Test successful user locations retrieval."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value=mock_locations_response)
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
+        patched_session(mock_locations_response)
 
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_user_locations()
+        result = await api.get_user_locations()
 
-            assert len(result) == 1
-            assert result[0]["id"] == "1"
-            assert result[0]["label"] == "Home"
+        assert len(result) == 1
+        assert result[0]["id"] == "1"
+        assert result[0]["label"] == "Home"
 
     @pytest.mark.asyncio
     async def test_get_user_locations_not_authenticated(self, api: LocaAPI) -> None:
@@ -609,63 +586,49 @@ class TestErrorHandling:
                 await api.get_assets()
 
     @pytest.mark.asyncio
-    async def test_json_decode_error(self, api: LocaAPI) -> None:
-        """Test handling of JSON decode errors."""
-        api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json.side_effect = ValueError("Invalid JSON")
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
-
-            assert result == []
-
-    @pytest.mark.asyncio
-    async def test_server_error_response(self, api: LocaAPI) -> None:
-        """Test handling of server error responses."""
+    @pytest.mark.parametrize(
+        ("status", "json_error"),
+        [
+            pytest.param(200, ValueError("Invalid JSON"), id="json_decode_error"),
+            pytest.param(500, None, id="server_error_response"),
+        ],
+    )
+    async def test_bad_response_returns_empty(
+        self,
+        api: LocaAPI,
+        patched_session: MockSessionFactory,
+        status: int,
+        json_error: Exception | None,
+    ) -> None:
+        """Test undecodable or failed responses yield no assets."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        _, mock_resp = patched_session(status=status, text="Internal Server Error")
+        if json_error is not None:
+            mock_resp.json = AsyncMock(side_effect=json_error)
 
-        mock_resp = MagicMock()
-        mock_resp.status = 500
-        mock_resp.text = AsyncMock(return_value="Internal Server Error")
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
+        result = await api.get_assets()
 
-            assert result == []
+        assert result == []
 
 
 class TestConcurrency:
     """Test concurrent API operations."""
 
     @pytest.mark.asyncio
-    async def test_concurrent_requests(self, api: LocaAPI) -> None:
+    async def test_concurrent_requests(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test handling multiple concurrent requests."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"status": "ok", "assets": []})
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
+        patched_session({"status": "ok", "assets": []})
 
-        with patch.object(api, "_get_session", return_value=mock_session):
-            # Make multiple concurrent requests
-            results = await asyncio.gather(
-                api.get_assets(), api.get_assets(), api.get_assets()
-            )
+        # Make multiple concurrent requests
+        results = await asyncio.gather(
+            api.get_assets(), api.get_assets(), api.get_assets()
+        )
 
-            assert all(isinstance(r, list) for r in results)
-            assert len(results) == 3
+        assert all(isinstance(r, list) for r in results)
+        assert len(results) == 3
 
 
 class TestConnectivityErrors:
@@ -769,68 +732,48 @@ class TestHTTPStatusCodes:
     """Test handling of various HTTP status codes."""
 
     @pytest.mark.asyncio
-    async def test_http_403_forbidden(self, api: LocaAPI) -> None:
+    async def test_http_403_forbidden(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test handling of HTTP 403 Forbidden."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session(status=403, text="Forbidden")
 
-        mock_resp = MagicMock()
-        mock_resp.status = 403
-        mock_resp.text = AsyncMock(return_value="Forbidden")
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
-            assert result == []
+        result = await api.get_assets()
+        assert result == []
 
     @pytest.mark.asyncio
-    async def test_http_404_not_found(self, api: LocaAPI) -> None:
+    async def test_http_404_not_found(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test handling of HTTP 404 Not Found."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session(status=404, text="Not Found")
 
-        mock_resp = MagicMock()
-        mock_resp.status = 404
-        mock_resp.text = AsyncMock(return_value="Not Found")
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
-            assert result == []
+        result = await api.get_assets()
+        assert result == []
 
     @pytest.mark.asyncio
-    async def test_http_429_rate_limit(self, api: LocaAPI) -> None:
+    async def test_http_429_rate_limit(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test handling of HTTP 429 Too Many Requests."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session(status=429, text="Rate limit exceeded")
 
-        mock_resp = MagicMock()
-        mock_resp.status = 429
-        mock_resp.text = AsyncMock(return_value="Rate limit exceeded")
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
-            assert result == []
+        result = await api.get_assets()
+        assert result == []
 
     @pytest.mark.asyncio
-    async def test_http_503_service_unavailable(self, api: LocaAPI) -> None:
+    async def test_http_503_service_unavailable(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test handling of HTTP 503 Service Unavailable."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 503
-        mock_resp.text = AsyncMock(return_value="Service Unavailable")
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
+        patched_session(status=503, text="Service Unavailable")
 
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
-            assert result == []
+        result = await api.get_assets()
+        assert result == []
 
 
 class TestAPIProperties:
@@ -869,7 +812,7 @@ class TestParseJsonOrLog:
     async def test_successful_parse(self, api: LocaAPI) -> None:
         """Test successful JSON parsing."""
         mock_response = MagicMock()
-        mock_response.json = AsyncMock(return_value={"key": "value"})
+        mock_response.json = async_return({"key": "value"})
 
         result = await api._parse_json_or_log(mock_response, "Test op")
         assert result == {"key": "value"}
@@ -914,7 +857,7 @@ class TestReauthAndRetry:
         # Retry response succeeds
         mock_retry_resp = MagicMock()
         mock_retry_resp.status = 200
-        mock_retry_resp.json = AsyncMock(return_value={"data": "ok"})
+        mock_retry_resp.json = async_return({"data": "ok"})
         mock_session.post.return_value.__aenter__.return_value = mock_retry_resp
 
         with patch.object(api, "authenticate", return_value=True):
@@ -1287,7 +1230,7 @@ class TestAuthenticationEdgeCases:
         mock_auth_resp = MagicMock()
         mock_auth_resp.status = 200
         mock_auth_resp.json = AsyncMock(side_effect=ValueError("Bad JSON"))
-        mock_auth_resp.text = AsyncMock(return_value="<html>Not JSON</html>")
+        mock_auth_resp.text = async_return("<html>Not JSON</html>")
 
         mock_session.get.return_value.__aenter__.return_value = mock_test_resp
         mock_session.post.return_value.__aenter__.return_value = mock_auth_resp
@@ -1306,7 +1249,7 @@ class TestAuthenticationEdgeCases:
 
         mock_auth_resp = MagicMock()
         mock_auth_resp.status = 200
-        mock_auth_resp.json = AsyncMock(return_value={"status": "ok"})
+        mock_auth_resp.json = async_return({"status": "ok"})
 
         mock_session.get.return_value.__aenter__.return_value = mock_test_resp
         mock_session.post.return_value.__aenter__.return_value = mock_auth_resp
@@ -1390,9 +1333,7 @@ class TestLogoutEdgeCases:
 
         mock_resp = MagicMock()
         mock_resp.status = 200
-        mock_resp.json = AsyncMock(
-            return_value={"status": "error", "message": "Session expired"}
-        )
+        mock_resp.json = async_return({"status": "error", "message": "Session expired"})
 
         mock_session.post.return_value.__aenter__.return_value = mock_resp
 
@@ -1442,20 +1383,15 @@ class TestGetAssetsEdgeCases:
     """Test get_assets with edge cases."""
 
     @pytest.mark.asyncio
-    async def test_get_assets_empty_list(self, api: LocaAPI) -> None:
+    async def test_get_assets_empty_list(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test get_assets returns empty list for empty assets."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"assets": []})
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
+        patched_session({"assets": []})
 
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_assets()
-            assert result == []
+        result = await api.get_assets()
+        assert result == []
 
 
 class TestGetStatusListEdgeCases:
@@ -1469,9 +1405,7 @@ class TestGetStatusListEdgeCases:
 
         mock_resp = MagicMock()
         mock_resp.status = 200
-        mock_resp.json = AsyncMock(
-            return_value={"StatusList": [{"Asset": {"id": "1"}}]}
-        )
+        mock_resp.json = async_return({"StatusList": [{"Asset": {"id": "1"}}]})
 
         mock_session.post.return_value.__aenter__.return_value = mock_resp
 
@@ -1480,20 +1414,15 @@ class TestGetStatusListEdgeCases:
             assert len(result) == 1
 
     @pytest.mark.asyncio
-    async def test_get_status_list_unexpected_response(self, api: LocaAPI) -> None:
+    async def test_get_status_list_unexpected_response(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test get_status_list with unexpected response."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session({"status": "error"})
 
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"status": "error"})
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_status_list()
-            assert result == []
+        result = await api.get_status_list()
+        assert result == []
 
 
 class TestGetUserLocationsEdgeCases:
@@ -1507,10 +1436,8 @@ class TestGetUserLocationsEdgeCases:
 
         mock_resp = MagicMock()
         mock_resp.status = 200
-        mock_resp.json = AsyncMock(
-            return_value={
-                "response": {"UserLocationList": [{"id": "1", "label": "Home"}]}
-            }
+        mock_resp.json = async_return(
+            {"response": {"UserLocationList": [{"id": "1", "label": "Home"}]}}
         )
 
         mock_session.post.return_value.__aenter__.return_value = mock_resp
@@ -1521,88 +1448,63 @@ class TestGetUserLocationsEdgeCases:
             assert result[0]["label"] == "Home"
 
     @pytest.mark.asyncio
-    async def test_get_user_locations_unexpected_response(self, api: LocaAPI) -> None:
+    async def test_get_user_locations_unexpected_response(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test get_user_locations with unexpected response."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session({"error": "not found"})
 
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"error": "not found"})
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_user_locations()
-            assert result == []
+        result = await api.get_user_locations()
+        assert result == []
 
 
 class TestGetGroupsEdgeCases:
     """Test get_groups edge cases."""
 
     @pytest.mark.asyncio
-    async def test_get_groups_direct_array(self, api: LocaAPI) -> None:
+    async def test_get_groups_direct_array(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test get_groups with direct array response."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value=[{"id": 1, "label": "Group 1"}])
+        patched_session([{"id": 1, "label": "Group 1"}])
 
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_groups()
-            assert len(result) == 1
+        result = await api.get_groups()
+        assert len(result) == 1
 
     @pytest.mark.asyncio
-    async def test_get_groups_error_response_dict(self, api: LocaAPI) -> None:
+    async def test_get_groups_error_response_dict(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test get_groups with error dict response."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
+        patched_session({"error": "Unauthorized"})
 
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"error": "Unauthorized"})
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
-
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_groups()
-            assert result == []
+        result = await api.get_groups()
+        assert result == []
 
     @pytest.mark.asyncio
-    async def test_get_groups_unexpected_format(self, api: LocaAPI) -> None:
+    async def test_get_groups_unexpected_format(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test get_groups with unexpected format dict."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"status": "ok"})
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
+        patched_session({"status": "ok"})
 
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_groups()
-            assert result == []
+        result = await api.get_groups()
+        assert result == []
 
     @pytest.mark.asyncio
-    async def test_get_groups_non_dict_non_list(self, api: LocaAPI) -> None:
+    async def test_get_groups_non_dict_non_list(
+        self, api: LocaAPI, patched_session: MockSessionFactory
+    ) -> None:
         """Test get_groups with non-dict, non-list response."""
         api._authenticated = True
-        mock_session = AsyncMock(spec=ClientSession)
-
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value="not a valid response")
-
-        mock_session.post.return_value.__aenter__.return_value = mock_resp
+        patched_session("not a valid response")
 
-        with patch.object(api, "_get_session", return_value=mock_session):
-            result = await api.get_groups()
-            assert result == []
+        result = await api.get_groups()
+        assert result == []
 
     @pytest.mark.asyncio
     async def test_get_groups_not_authenticated(self, api: LocaAPI) -> None:
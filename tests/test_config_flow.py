@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+import hashlib
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant import config_entries
@@ -14,6 +16,7 @@ from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,  # type: ignore[import-untyped]
 )
 
+from custom_components.loca.api import LocaAPI
 from custom_components.loca.config_flow import (
     CannotConnect,
     InvalidAuth,
@@ -22,44 +25,91 @@ from custom_components.loca.config_flow import (
 from custom_components.loca.const import CONF_API_KEY, DOMAIN
 from custom_components.loca.error_handling import LocaAPIUnavailableError
 
+# Patch targets shared by the tests below
+_PATCH_LOCA_API = "custom_components.loca.config_flow.LocaAPI"
+_PATCH_SETUP_ENTRY = "custom_components.loca.async_setup_entry"
+_PATCH_VALIDATE = "custom_components.loca.config_flow.validate_input"
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_setup_entry() -> Generator[AsyncMock, None, None]:
-    """Mock setup entry."""
-    with patch(
-        "custom_components.loca.async_setup_entry",
-        return_value=True,
-    ) as mock:
+    """Mock setup entry; patched once per module, reset per test."""
+    with patch(_PATCH_SETUP_ENTRY, return_value=True) as mock:
         yield mock
 
 
-@pytest.fixture
+# Return values the shared API mock starts every test with
+_API_MOCK_DEFAULTS: dict[str, object] = {
+    "authenticate.return_value": True,
+    "get_assets.return_value": [{"id": "123", "name": "Test Device"}],
+}
+
+
+@pytest.fixture(scope="module")
 def mock_loca_api() -> Generator[MagicMock, None, None]:
-    """Mock Loca API."""
-    with patch("custom_components.loca.config_flow.LocaAPI") as mock_class:
-        mock_api = AsyncMock()
+    """Mock Loca API; patched once per module, reset per test."""
+    with patch(_PATCH_LOCA_API) as mock_class:
+        mock_api = AsyncMock(spec=LocaAPI)
+        mock_api.configure_mock(**_API_MOCK_DEFAULTS)
         mock_class.return_value = mock_api
-        mock_api.authenticate = AsyncMock(return_value=True)
-        mock_api.get_assets = AsyncMock(
-            return_value=[{"id": "123", "name": "Test Device"}]
-        )
-        mock_api.close = AsyncMock()
         yield mock_api
 
 
-@pytest.fixture
-def user_input() -> dict[str, str]:
-    """User input for config flow."""
-    return {
+@pytest.fixture(autouse=True)
+def reset_module_mocks(request: pytest.FixtureRequest) -> None:
+    """Clear call history and side effects left on the module-scoped mocks.
+
+    The API mock also gets its default return values back, so tests may
+    override them freely.
+    """
+    if "mock_setup_entry" in request.fixturenames:
+        request.getfixturevalue("mock_setup_entry").reset_mock(side_effect=True)
+    if "mock_loca_api" in request.fixturenames:
+        mock_api = request.getfixturevalue("mock_loca_api")
+        mock_api.reset_mock(return_value=True, side_effect=True)
+        mock_api.configure_mock(**_API_MOCK_DEFAULTS)
+
+
+_USER_INPUT: Mapping[str, str] = MappingProxyType(
+    {
         CONF_API_KEY: "test_api_key",
         CONF_USERNAME: "test_user",
         CONF_PASSWORD: "test_password",
     }
+)
+
+# Unique ID the flow derives from _USER_INPUT: username plus API key hash
+_API_KEY_HASH = hashlib.sha256(_USER_INPUT[CONF_API_KEY].encode()).hexdigest()[:8]
+_UNIQUE_ID = f"{_USER_INPUT[CONF_USERNAME]}_{_API_KEY_HASH}"
+
+
+@pytest.fixture
+def user_input() -> Mapping[str, str]:
+    """User input for config flow, shared read-only across tests."""
+    return _USER_INPUT
 
 
 class TestConfigFlow:
     """Test the Loca config flow."""
 
+    async def _submit_user_step(
+        self, hass: HomeAssistant, user_input: Mapping[str, str]
+    ) -> dict:  # type: ignore[type-arg]
+        """Start a user flow and submit `user_input` to its first step.
+
+        The input is copied into a plain dict, which the step schema requires.
+        Pending flow tasks are drained before returning, so they finish while
+        the caller's patches are still active.
+        """
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], dict(user_input)
+        )
+        await hass.async_block_till_done()
+        return result  # type: ignore[return-value]
+
     async def test_form_user(self, hass: HomeAssistant) -> None:
         """Test we get the form."""
         result = await hass.config_entries.flow.async_init(
@@ -75,23 +125,15 @@ class TestConfigFlow:
         hass: HomeAssistant,
         mock_loca_api: MagicMock,
         mock_setup_entry: AsyncMock,
-        user_input: dict[str, str],
+        user_input: Mapping[str, str],
         expected_lingering_tasks,
     ) -> None:
         """Test successful user form submission."""
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": config_entries.SOURCE_USER}
-        )
+        result = await self._submit_user_step(hass, user_input)
 
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            user_input,
-        )
-        await hass.async_block_till_done()
-
-        assert result2["type"] is FlowResultType.CREATE_ENTRY
-        assert result2["title"] == "Loca (test_user)"
-        assert result2["data"] == user_input
+        assert result["type"] is FlowResultType.CREATE_ENTRY
+        assert result["title"] == "Loca (test_user)"
+        assert result["data"] == user_input
 
         mock_loca_api.authenticate.assert_called_once()
         mock_loca_api.get_assets.assert_called_once()
@@ -100,107 +142,69 @@ class TestConfigFlow:
     async def test_form_cannot_connect(
         self,
         hass: HomeAssistant,
-        user_input: dict[str, str],
+        mock_setup_entry: AsyncMock,
+        user_input: Mapping[str, str],
     ) -> None:
         """Test we handle cannot connect error."""
-        with patch(
-            "custom_components.loca.config_flow.validate_input"
-        ) as mock_validate:
+        with patch(_PATCH_VALIDATE) as mock_validate:
             mock_validate.side_effect = CannotConnect
 
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
-
-            result2 = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                user_input,
-            )
+            result = await self._submit_user_step(hass, user_input)
 
-            assert result2["type"] is FlowResultType.FORM
-            assert result2["errors"] == {"base": "cannot_connect"}
+            assert result["type"] is FlowResultType.FORM
+            assert result["errors"] == {"base": "cannot_connect"}
 
     async def test_form_invalid_auth(
         self,
         hass: HomeAssistant,
-        user_input: dict[str, str],
+        mock_setup_entry: AsyncMock,
+        user_input: Mapping[str, str],
     ) -> None:
         """Test we handle invalid auth error."""
-        with patch(
-            "custom_components.loca.config_flow.validate_input"
-        ) as mock_validate:
+        with patch(_PATCH_VALIDATE) as mock_validate:
             mock_validate.side_effect = InvalidAuth
 
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
+            result = await self._submit_user_step(hass, user_input)
 
-            result2 = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                user_input,
-            )
-
-            assert result2["type"] is FlowResultType.FORM
-            assert result2["errors"] == {"base": "invalid_auth"}
+            assert result["type"] is FlowResultType.FORM
+            assert result["errors"] == {"base": "invalid_auth"}
 
     async def test_form_unknown_error(
         self,
         hass: HomeAssistant,
-        user_input: dict[str, str],
+        mock_setup_entry: AsyncMock,
+        user_input: Mapping[str, str],
     ) -> None:
         """Test we handle unknown error."""
-        with patch(
-            "custom_components.loca.config_flow.validate_input"
-        ) as mock_validate:
+        with patch(_PATCH_VALIDATE) as mock_validate:
             mock_validate.side_effect = Exception("Unexpected error")
 
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
-
-            result2 = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                user_input,
-            )
+            result = await self._submit_user_step(hass, user_input)
 
-            assert result2["type"] is FlowResultType.FORM
-            assert result2["errors"] == {"base": "unknown"}
+            assert result["type"] is FlowResultType.FORM
+            assert result["errors"] == {"base": "unknown"}
 
     async def test_form_already_configured(
         self,
         hass: HomeAssistant,
-        user_input: dict[str, str],
+        mock_setup_entry: AsyncMock,
+        user_input: Mapping[str, str],
     ) -> None:
         """Test we abort if already configured."""
-        import hashlib
-
-        # Create unique_id that matches the new format with hash
-        api_key_hash = hashlib.sha256(user_input[CONF_API_KEY].encode()).hexdigest()[:8]
-        unique_id = f"{user_input[CONF_USERNAME]}_{api_key_hash}"
-
         existing_entry = MockConfigEntry(
             domain=DOMAIN,
-            unique_id=unique_id,
+            unique_id=_UNIQUE_ID,
             data=user_input,
         )
         existing_entry.add_to_hass(hass)
 
-        with patch(
-            "custom_components.loca.config_flow.validate_input"
-        ) as mock_validate:
+        with patch(_PATCH_VALIDATE) as mock_validate:
             mock_validate.return_value = {"title": "Loca (test_user)"}
 
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
-
-            result2 = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                user_input,
-            )
+            result = await self._submit_user_step(hass, user_input)
 
-            assert result2["type"] is FlowResultType.ABORT
-            assert result2["reason"] == "already_configured"
+            assert result["type"] is FlowResultType.ABORT
+            assert result["reason"] == "already_configured"
 
 
 class TestValidateInput:
@@ -209,7 +213,7 @@ class TestValidateInput:
     async def test_validate_input_success(
         self,
         hass: HomeAssistant,
-        user_input: dict[str, str],
+        user_input: Mapping[str, str],
         mock_loca_api: MagicMock,
     ) -> None:
         """Test successful input validation."""
@@ -220,94 +224,58 @@ class TestValidateInput:
         mock_loca_api.get_assets.assert_called_once()
         mock_loca_api.close.assert_called_once()
 
-    async def test_validate_input_auth_failure(
-        self,
-        hass: HomeAssistant,
-        user_input: dict[str, str],
-    ) -> None:
-        """Test that API-unavailable errors during auth surface as CannotConnect."""
-        with patch("custom_components.loca.config_flow.LocaAPI") as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.authenticate.side_effect = LocaAPIUnavailableError("Auth failed")
-            mock_api.close = AsyncMock()
-
-            with pytest.raises(CannotConnect):
-                await validate_input(hass, user_input)
-
-            mock_api.close.assert_called_once()
-
-    async def test_validate_input_no_auth(
-        self,
-        hass: HomeAssistant,
-        user_input: dict[str, str],
-    ) -> None:
-        """Test validation when authentication returns False."""
-        with patch("custom_components.loca.config_flow.LocaAPI") as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.authenticate.return_value = False
-            mock_api.close = AsyncMock()
-
-            with pytest.raises(InvalidAuth):
-                await validate_input(hass, user_input)
-
-            mock_api.close.assert_called_once()
-
-    async def test_validate_input_no_devices(
+    @pytest.mark.parametrize(
+        ("auth", "assets", "expected"),
+        [
+            pytest.param(True, [], None, id="no_devices"),
+            pytest.param(False, None, InvalidAuth, id="auth_rejected"),
+            pytest.param(
+                LocaAPIUnavailableError("Auth failed"),
+                None,
+                CannotConnect,
+                id="auth_unavailable",
+            ),
+            pytest.param(
+                True,
+                LocaAPIUnavailableError("Network error"),
+                CannotConnect,
+                id="assets_unavailable",
+            ),
+            pytest.param(
+                True,
+                RuntimeError("programming bug"),
+                RuntimeError,
+                id="unexpected_error_propagates",
+            ),
+        ],
+    )
+    async def test_validate_input_outcomes(
         self,
         hass: HomeAssistant,
-        user_input: dict[str, str],
+        user_input: Mapping[str, str],
+        mock_loca_api: MagicMock,
+        auth: bool | Exception,
+        assets: list[dict[str, str]] | Exception | None,
+        expected: type[Exception] | None,
     ) -> None:
-        """Test validation with no devices (should succeed)."""
-        with patch("custom_components.loca.config_flow.LocaAPI") as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.authenticate.return_value = True
-            mock_api.get_assets.return_value = []
-            mock_api.close = AsyncMock()
+        """Test validation outcomes; the API is closed on every path."""
+        for method, outcome in (
+            (mock_loca_api.authenticate, auth),
+            (mock_loca_api.get_assets, assets),
+        ):
+            if isinstance(outcome, Exception):
+                method.side_effect = outcome
+            else:
+                method.return_value = outcome
 
+        if expected is None:
             result = await validate_input(hass, user_input)
             assert result["title"] == "Loca (test_user)"
-
-            mock_api.close.assert_called_once()
-
-    async def test_validate_input_closes_api_on_exception(
-        self,
-        hass: HomeAssistant,
-        user_input: dict[str, str],
-    ) -> None:
-        """Test that API is closed even when API-unavailable errors occur."""
-        with patch("custom_components.loca.config_flow.LocaAPI") as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.authenticate.return_value = True
-            mock_api.get_assets.side_effect = LocaAPIUnavailableError("Network error")
-            mock_api.close = AsyncMock()
-
-            with pytest.raises(CannotConnect):
+        else:
+            with pytest.raises(expected):
                 await validate_input(hass, user_input)
 
-            mock_api.close.assert_called_once()
-
-    async def test_validate_input_unexpected_exception_propagates(
-        self,
-        hass: HomeAssistant,
-        user_input: dict[str, str],
-    ) -> None:
-        """Test that unexpected exceptions propagate (caller maps to 'unknown')."""
-        with patch("custom_components.loca.config_flow.LocaAPI") as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.authenticate.return_value = True
-            mock_api.get_assets.side_effect = RuntimeError("programming bug")
-            mock_api.close = AsyncMock()
-
-            with pytest.raises(RuntimeError):
-                await validate_input(hass, user_input)
-
-            # The finally block must still close the API session.
-            mock_api.close.assert_called_once()
+        mock_loca_api.close.assert_called_once()
 
 
 class TestReauthFlow:
@@ -368,11 +336,11 @@ class TestReauthFlow:
 
         with (
             patch(
-                "custom_components.loca.config_flow.validate_input",
+                _PATCH_VALIDATE,
                 return_value={"title": "Loca (test_user)"},
             ),
             patch(
-                "custom_components.loca.async_setup_entry",
+                _PATCH_SETUP_ENTRY,
                 return_value=True,
             ),
         ):
@@ -408,7 +376,7 @@ class TestReauthFlow:
         result = await self._start_reauth_flow(hass, entry)
 
         with patch(
-            "custom_components.loca.config_flow.validate_input",
+            _PATCH_VALIDATE,
             side_effect=CannotConnect,
         ):
             result2 = await hass.config_entries.flow.async_configure(
@@ -442,7 +410,7 @@ class TestReauthFlow:
         result = await self._start_reauth_flow(hass, entry)
 
         with patch(
-            "custom_components.loca.config_flow.validate_input",
+            _PATCH_VALIDATE,
             side_effect=InvalidAuth,
         ):
             result2 = await hass.config_entries.flow.async_configure(
@@ -476,7 +444,7 @@ class TestReauthFlow:
         result = await self._start_reauth_flow(hass, entry)
 
         with patch(
-            "custom_components.loca.config_flow.validate_input",
+            _PATCH_VALIDATE,
             side_effect=Exception("unexpected"),
         ):
             result2 = await hass.config_entries.flow.async_configure(
@@ -512,7 +480,7 @@ class TestConfigFlowOptions:
         entry.add_to_hass(hass)
 
         # Register the config flow
-        with patch("custom_components.loca.async_setup_entry", return_value=True):
+        with patch(_PATCH_SETUP_ENTRY, return_value=True):
             result = await hass.config_entries.options.async_init(entry.entry_id)
 
         # The options flow should show a form
@@ -536,7 +504,7 @@ class TestConfigFlowOptions:
         )
         entry.add_to_hass(hass)
 
-        with patch("custom_components.loca.async_setup_entry", return_value=True):
+        with patch(_PATCH_SETUP_ENTRY, return_value=True):
             result = await hass.config_entries.options.async_init(entry.entry_id)
 
             result2 = await hass.config_entries.options.async_configure(
@@ -1,7 +1,10 @@
 """Tests for Loca coordinator."""
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -12,17 +15,65 @@ from custom_components.loca.const import DEFAULT_SCAN_INTERVAL, DOMAIN
 from custom_components.loca.coordinator import LocaDataUpdateCoordinator
 from custom_components.loca.error_handling import LocaAPIUnavailableError
 
+# Fixed timestamp for mocked device data, matching the mocked status entry
+_FIXED_NOW = datetime(2022, 4, 26, 19, 35, 6)
+
+# Parsed device record shared read-only by the update tests
+_MOCK_DEVICE: Mapping[str, Any] = MappingProxyType(
+    {
+        "device_id": "12345",
+        "name": "Test Device",
+        "latitude": 52.0,
+        "longitude": 4.0,
+        "battery_level": 85,
+        "gps_accuracy": 10,
+        "location_source": "GPS",
+        "last_seen": _FIXED_NOW,
+        "address": "Test Street 1",
+    }
+)
+
+
+class _FakeApi:
+    """Authenticated stand-in for LocaAPI in coordinator update tests."""
+
+    is_authenticated = True
+
+    def __init__(
+        self,
+        *,
+        status: list[dict[str, Any]] | Exception,
+        device: Mapping[str, Any] | None = None,
+        groups_error: Exception | None = None,
+    ) -> None:
+        """Store the canned results the API calls hand back."""
+        self.status = status
+        self.device = device
+        self.groups_error = groups_error
+
+    async def update_groups_cache(self) -> None:
+        """Refresh nothing, or fail with the configured error."""
+        if self.groups_error is not None:
+            raise self.groups_error
+
+    async def get_status_list(self) -> list[dict[str, Any]]:
+        """Return the canned status list, or raise the configured error."""
+        if isinstance(self.status, Exception):
+            raise self.status
+        return self.status
+
+    def parse_status_as_device(self, status_entry: dict[str, Any]) -> Mapping[str, Any]:
+        """Return the canned device record for any status entry."""
+        assert self.device is not None
+        return self.device
+
 
 class TestLocaDataUpdateCoordinator:
     """Test the Loca data update coordinator."""
 
-    @pytest.mark.asyncio
-    async def test_init(
-        self, hass: HomeAssistant, mock_config_entry, expected_lingering_tasks
-    ):
+    @pytest.mark.usefixtures("expected_lingering_tasks")
+    async def test_init(self, coordinator, mock_config_entry):
         """Test coordinator initialization."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         assert coordinator.config_entry == mock_config_entry
         assert coordinator.name == DOMAIN
         assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
@@ -30,35 +81,15 @@ class TestLocaDataUpdateCoordinator:
         assert coordinator.api._username == "test_user"
         assert coordinator.api._password == "test_password"
 
-    @pytest.mark.asyncio
-    async def test_async_update_data_empty_response(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
-        """Test data update with empty response."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
-        with patch.object(coordinator.api, "authenticate", return_value=False):
-            with pytest.raises(ConfigEntryAuthFailed):
-                await coordinator._async_update_data()
+    async def test_async_update_data_auth_failure(self, coordinator):
+        """Test data update raises ConfigEntryAuthFailed when login fails."""
+        coordinator.api.authenticate = AsyncMock(return_value=False)
 
-    @pytest.mark.asyncio
-    async def test_async_update_data_api_exception(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
-        """Test data update with API exception."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
-        with patch.object(coordinator.api, "authenticate", return_value=False):
-            with pytest.raises(ConfigEntryAuthFailed):
-                await coordinator._async_update_data()
+        with pytest.raises(ConfigEntryAuthFailed, match="Authentication failed"):
+            await coordinator._async_update_data()
 
-    @pytest.mark.asyncio
-    async def test_async_update_data_with_location_parsing(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_async_update_data_with_location_parsing(self, coordinator):
         """Test data update with proper location data parsing."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         mock_status = {
             "asset_id": "test123",
             "asset_label": "Test Location Tracker",
@@ -73,16 +104,9 @@ class TestLocaDataUpdateCoordinator:
             "timestamp": "2022-04-26 19:35:06",
         }
 
-        with (
-            patch.object(coordinator.api, "_authenticated", True),
-            patch.object(coordinator.api, "update_groups_cache", return_value=None),
-            patch.object(
-                coordinator.api, "get_status_list", return_value=[mock_status]
-            ),
-            patch.object(coordinator.api, "parse_status_as_device") as mock_parse,
-        ):
-            # Mock parse_status_as_device to return proper device data
-            mock_parse.return_value = {
+        coordinator.api = _FakeApi(
+            status=[mock_status],
+            device={
                 "device_id": "test123",
                 "name": "Test Location Tracker",
                 "battery_level": None,
@@ -90,285 +114,154 @@ class TestLocaDataUpdateCoordinator:
                 "longitude": 5.0000,
                 "gps_accuracy": 25,
                 "location_source": "GPS",
-                "last_seen": datetime.now(),
+                "last_seen": _FIXED_NOW,
                 "address": "Test Street 42",
-            }
+            },
+        )
 
-            result = await coordinator._async_update_data()
+        result = await coordinator._async_update_data()
 
-            assert len(result) == 1
-            assert "test123" in result
+        assert len(result) == 1
+        assert "test123" in result
 
-            device = result["test123"]
-            assert device["device_id"] == "test123"
-            assert device["name"] == "Test Location Tracker"
-            assert device["battery_level"] is None  # Locations don't have battery
-            assert device["latitude"] == 50.0000
-            assert device["longitude"] == 5.0000
-            assert device["gps_accuracy"] == 25
-            assert device["location_source"] == "GPS"
-            assert isinstance(device["last_seen"], datetime)
-            assert "Test Street 42" in device["address"]
+        device = result["test123"]
+        assert device["device_id"] == "test123"
+        assert device["name"] == "Test Location Tracker"
+        assert device["battery_level"] is None  # Locations don't have battery
+        assert device["latitude"] == 50.0000
+        assert device["longitude"] == 5.0000
+        assert device["gps_accuracy"] == 25
+        assert device["location_source"] == "GPS"
+        assert isinstance(device["last_seen"], datetime)
+        assert "Test Street 42" in device["address"]
 
-    @pytest.mark.asyncio
-    async def test_async_shutdown(self, hass: HomeAssistant, mock_config_entry):
+    async def test_async_shutdown(self, coordinator):
         """Test coordinator shutdown."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
+        coordinator.api.close = AsyncMock(return_value=None)
 
-        with patch.object(coordinator.api, "close", return_value=None) as mock_close:
-            await coordinator.async_shutdown()
+        await coordinator.async_shutdown()
 
-            mock_close.assert_called_once()
+        coordinator.api.close.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_device_data_transformation(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
-        """Test device data transformation with authentication failure."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
-        with patch.object(coordinator.api, "authenticate", return_value=False):
-            with pytest.raises(ConfigEntryAuthFailed):
-                await coordinator._async_update_data()
-
-    @pytest.mark.asyncio
-    async def test_update_interval_configuration(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_update_interval_configuration(self, coordinator):
         """Test that update interval is properly configured."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         assert coordinator.update_interval is not None
         assert coordinator.update_interval.total_seconds() == DEFAULT_SCAN_INTERVAL
 
-    @pytest.mark.asyncio
-    async def test_logger_configuration(self, hass: HomeAssistant, mock_config_entry):
+    async def test_logger_configuration(self, coordinator):
         """Test that logger is properly configured."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         # The logger should be set to the coordinator's logger
         assert coordinator.logger.name.endswith("coordinator")
 
-    @pytest.mark.asyncio
-    async def test_update_data_with_groups_cache(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
-        """Test data update includes groups cache update."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
-        with patch.object(coordinator.api, "authenticate", return_value=False):
-            with pytest.raises(ConfigEntryAuthFailed, match="Authentication failed"):
-                await coordinator._async_update_data()
-
 
 class TestCoordinatorErrorHandling:
     """Test coordinator error handling."""
 
     @pytest.mark.asyncio
-    async def test_api_unavailable_raises_update_failed(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_api_unavailable_raises_update_failed(self, coordinator):
         """Test that LocaAPIUnavailableError raises UpdateFailed."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
+        coordinator.api = _FakeApi(
+            status=LocaAPIUnavailableError("API temporarily unavailable"),
+        )
 
-        with (
-            patch.object(coordinator.api, "_authenticated", True),
-            patch.object(coordinator.api, "update_groups_cache", return_value=None),
-            patch.object(
-                coordinator.api,
-                "get_status_list",
-                side_effect=LocaAPIUnavailableError("API temporarily unavailable"),
-            ),
-        ):
-            with pytest.raises(UpdateFailed) as exc_info:
-                await coordinator._async_update_data()
+        with pytest.raises(UpdateFailed) as exc_info:
+            await coordinator._async_update_data()
 
-            assert "temporarily unavailable" in str(exc_info.value)
+        assert "temporarily unavailable" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_authentication_error_raises_config_entry_auth_failed(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
-        """Test that authentication errors raise ConfigEntryAuthFailed."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
-        with patch.object(coordinator.api, "authenticate", return_value=False):
-            with pytest.raises(ConfigEntryAuthFailed):
+    async def test_api_unavailable_during_login_raises_update_failed(self, coordinator):
+        """Test an unreachable API while logging in is not treated as bad auth."""
+        with patch.object(
+            coordinator.api,
+            "authenticate",
+            side_effect=LocaAPIUnavailableError("Login timed out"),
+        ):
+            with pytest.raises(UpdateFailed, match="temporarily unavailable"):
                 await coordinator._async_update_data()
 
     @pytest.mark.asyncio
-    async def test_generic_exception_raises_update_failed(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_generic_exception_raises_update_failed(self, coordinator):
         """Test that generic exceptions raise UpdateFailed."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
+        coordinator.api = _FakeApi(status=ValueError("Unexpected error"))
 
-        with (
-            patch.object(coordinator.api, "_authenticated", True),
-            patch.object(coordinator.api, "update_groups_cache", return_value=None),
-            patch.object(
-                coordinator.api,
-                "get_status_list",
-                side_effect=ValueError("Unexpected error"),
-            ),
-        ):
-            with pytest.raises(UpdateFailed) as exc_info:
-                await coordinator._async_update_data()
+        with pytest.raises(UpdateFailed) as exc_info:
+            await coordinator._async_update_data()
 
-            assert "Error communicating with API" in str(exc_info.value)
+        assert "Error communicating with API" in str(exc_info.value)
 
     @pytest.mark.asyncio
     async def test_auth_keyword_in_error_raises_config_entry_auth_failed(
-        self, hass: HomeAssistant, mock_config_entry
+        self, coordinator
     ):
         """Test that errors containing auth keywords raise ConfigEntryAuthFailed."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
+        coordinator.api = _FakeApi(status=Exception("Unauthorized access denied"))
 
-        with (
-            patch.object(coordinator.api, "_authenticated", True),
-            patch.object(coordinator.api, "update_groups_cache", return_value=None),
-            patch.object(
-                coordinator.api,
-                "get_status_list",
-                side_effect=Exception("Unauthorized access denied"),
-            ),
-        ):
-            with pytest.raises(ConfigEntryAuthFailed) as exc_info:
-                await coordinator._async_update_data()
+        with pytest.raises(ConfigEntryAuthFailed) as exc_info:
+            await coordinator._async_update_data()
 
-            assert "Authentication error" in str(exc_info.value)
+        assert "Authentication error" in str(exc_info.value)
 
     @pytest.mark.asyncio
     async def test_403_forbidden_error_raises_config_entry_auth_failed(
-        self, hass: HomeAssistant, mock_config_entry
+        self, coordinator
     ):
         """Test that 403 forbidden errors raise ConfigEntryAuthFailed."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
+        coordinator.api = _FakeApi(status=Exception("HTTP 403 Forbidden"))
 
-        with (
-            patch.object(coordinator.api, "_authenticated", True),
-            patch.object(coordinator.api, "update_groups_cache", return_value=None),
-            patch.object(
-                coordinator.api,
-                "get_status_list",
-                side_effect=Exception("HTTP 403 Forbidden"),
-            ),
-            pytest.raises(ConfigEntryAuthFailed),
-        ):
+        with pytest.raises(ConfigEntryAuthFailed):
             await coordinator._async_update_data()
 
     @pytest.mark.asyncio
-    async def test_successful_update_after_api_unavailable(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_successful_update_after_api_unavailable(self, coordinator):
         """Test successful update after API was unavailable."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
-        mock_device = {
-            "device_id": "12345",
-            "name": "Test Device",
-            "latitude": 52.0,
-            "longitude": 4.0,
-            "battery_level": 85,
-            "gps_accuracy": 10,
-            "location_source": "GPS",
-            "last_seen": datetime.now(),
-            "address": "Test Street 1",
-        }
+        coordinator.api = _FakeApi(
+            status=[{"Asset": {"id": "12345"}}], device=_MOCK_DEVICE
+        )
 
-        with (
-            patch.object(coordinator.api, "_authenticated", True),
-            patch.object(coordinator.api, "update_groups_cache", return_value=None),
-            patch.object(
-                coordinator.api,
-                "get_status_list",
-                return_value=[{"Asset": {"id": "12345"}}],
-            ),
-            patch.object(
-                coordinator.api, "parse_status_as_device", return_value=mock_device
-            ),
-        ):
-            result = await coordinator._async_update_data()
+        result = await coordinator._async_update_data()
 
-            assert len(result) == 1
-            assert "12345" in result
-            assert result["12345"]["name"] == "Test Device"
+        assert len(result) == 1
+        assert "12345" in result
+        assert result["12345"]["name"] == "Test Device"
 
     @pytest.mark.asyncio
-    async def test_empty_status_list(self, hass: HomeAssistant, mock_config_entry):
+    async def test_empty_status_list(self, coordinator):
         """Test handling of empty status list."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
+        coordinator.api = _FakeApi(status=[])
 
-        with (
-            patch.object(coordinator.api, "_authenticated", True),
-            patch.object(coordinator.api, "update_groups_cache", return_value=None),
-            patch.object(coordinator.api, "get_status_list", return_value=[]),
-        ):
-            result = await coordinator._async_update_data()
+        result = await coordinator._async_update_data()
 
-            # Empty result should be returned
-            assert result == {}
+        # Empty result should be returned
+        assert result == {}
 
     @pytest.mark.asyncio
-    async def test_groups_cache_update_failure_continues(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
-        """Test that groups cache update failure doesn't stop data update."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
-        mock_device = {
-            "device_id": "12345",
-            "name": "Test Device",
-            "latitude": 52.0,
-            "longitude": 4.0,
-            "battery_level": 85,
-            "gps_accuracy": 10,
-            "location_source": "GPS",
-            "last_seen": datetime.now(),
-            "address": "Test Street 1",
-        }
+    async def test_groups_cache_update_failure_fails_update(self, coordinator):
+        """Test that a groups cache update failure fails the data update."""
+        coordinator.api = _FakeApi(
+            status=[{"Asset": {"id": "12345"}}],
+            device=_MOCK_DEVICE,
+            groups_error=Exception("Groups API error"),
+        )
 
-        with (
-            patch.object(coordinator.api, "_authenticated", True),
-            patch.object(
-                coordinator.api,
-                "update_groups_cache",
-                side_effect=Exception("Groups API error"),
-            ),
-            patch.object(
-                coordinator.api,
-                "get_status_list",
-                return_value=[{"Asset": {"id": "12345"}}],
-            ),
-            patch.object(
-                coordinator.api, "parse_status_as_device", return_value=mock_device
-            ),
-        ):
-            # Should not raise - groups cache error is non-fatal
-            with pytest.raises(UpdateFailed):
-                await coordinator._async_update_data()
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
 
 
 class TestHandleEmptyStatusList:
     """Test _handle_empty_status_list helper method."""
 
     @pytest.mark.asyncio
-    async def test_empty_status_not_authenticated(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_empty_status_not_authenticated(self, coordinator):
         """Test empty status list when not authenticated raises ConfigEntryAuthFailed."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
         coordinator.api._authenticated = False
 
         with pytest.raises(ConfigEntryAuthFailed, match="Authentication required"):
             coordinator._handle_empty_status_list()
 
     @pytest.mark.asyncio
-    async def test_empty_status_below_threshold(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_empty_status_below_threshold(self, coordinator):
         """Test empty status list below threshold does not create repair issue."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
         coordinator.api._authenticated = True
 
         # First empty run - below threshold
@@ -377,12 +270,11 @@ class TestHandleEmptyStatusList:
 
     @pytest.mark.asyncio
     async def test_empty_status_at_threshold_creates_repair(
-        self, hass: HomeAssistant, mock_config_entry
+        self, hass: HomeAssistant, mock_config_entry, coordinator
     ):
         """Test empty status list at threshold creates repair issue."""
         from custom_components.loca.const import EMPTY_DEVICE_THRESHOLD
 
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
         coordinator.api._authenticated = True
 
         with patch(
@@ -395,11 +287,8 @@ class TestHandleEmptyStatusList:
             mock_create.assert_called_once_with(hass, mock_config_entry)
 
     @pytest.mark.asyncio
-    async def test_empty_status_no_config_entry(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_empty_status_no_config_entry(self, coordinator):
         """Test empty status when not authenticated and config_entry is None."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
         coordinator.api._authenticated = False
         # Simulate config_entry being None
         coordinator.config_entry = None
@@ -412,12 +301,8 @@ class TestBuildDevicesFromStatus:
     """Test _build_devices_from_status helper method."""
 
     @pytest.mark.asyncio
-    async def test_builds_devices_correctly(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_builds_devices_correctly(self, coordinator):
         """Test building devices from status list."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         mock_device_1 = {
             "device_id": "dev1",
             "name": "Device 1",
@@ -448,14 +333,10 @@ class TestBuildDevicesFromStatus:
         assert "dev2" in result
 
     @pytest.mark.asyncio
-    async def test_logs_new_device_discovery(
-        self, hass: HomeAssistant, mock_config_entry, caplog
-    ):
+    async def test_logs_new_device_discovery(self, coordinator, caplog):
         """Test that new device discovery is logged."""
         import logging
 
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         # Set previous data
         coordinator.data = {"dev1": {"device_id": "dev1", "name": "Old Device"}}
 
@@ -474,11 +355,8 @@ class TestBuildDevicesFromStatus:
         assert "New device discovered" in caplog.text
 
     @pytest.mark.asyncio
-    async def test_resets_empty_count_on_success(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_resets_empty_count_on_success(self, coordinator):
         """Test that empty device count is reset when devices are found."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
         coordinator._empty_device_count = 5
 
         mock_device = {"device_id": "dev1", "name": "Device"}
@@ -499,13 +377,10 @@ class TestLogRemovedDevices:
     """Test _log_removed_devices helper method."""
 
     @pytest.mark.asyncio
-    async def test_logs_removed_devices(
-        self, hass: HomeAssistant, mock_config_entry, caplog
-    ):
+    async def test_logs_removed_devices(self, coordinator, caplog):
         """Test that removed devices are logged."""
         import logging
 
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
         coordinator.data = {
             "dev1": {"device_id": "dev1", "name": "Device 1"},
             "dev2": {"device_id": "dev2", "name": "Device 2"},
@@ -518,13 +393,10 @@ class TestLogRemovedDevices:
         assert "dev2" in caplog.text
 
     @pytest.mark.asyncio
-    async def test_no_log_when_no_previous_data(
-        self, hass: HomeAssistant, mock_config_entry, caplog
-    ):
+    async def test_no_log_when_no_previous_data(self, coordinator, caplog):
         """Test no logging when there is no previous data."""
         import logging
 
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
         coordinator.data = None  # type: ignore[assignment]
 
         with caplog.at_level(logging.INFO):
@@ -533,13 +405,10 @@ class TestLogRemovedDevices:
         assert "Device removed" not in caplog.text
 
     @pytest.mark.asyncio
-    async def test_no_log_when_all_present(
-        self, hass: HomeAssistant, mock_config_entry, caplog
-    ):
+    async def test_no_log_when_all_present(self, coordinator, caplog):
         """Test no logging when all devices are still present."""
         import logging
 
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
         coordinator.data = {
             "dev1": {"device_id": "dev1", "name": "Device 1"},
         }
@@ -554,32 +423,22 @@ class TestClassifyAndRaise:
     """Test _classify_and_raise helper method."""
 
     @pytest.mark.asyncio
-    async def test_auth_error_terms_raise_config_entry_auth_failed(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_auth_error_terms_raise_config_entry_auth_failed(self, coordinator):
         """Test that auth-related error messages raise ConfigEntryAuthFailed."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         with pytest.raises(ConfigEntryAuthFailed):
             coordinator._classify_and_raise(Exception("401 Unauthorized"))
 
     @pytest.mark.asyncio
-    async def test_generic_error_raises_update_failed(
-        self, hass: HomeAssistant, mock_config_entry
-    ):
+    async def test_generic_error_raises_update_failed(self, coordinator):
         """Test that generic errors raise UpdateFailed."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         with pytest.raises(UpdateFailed, match="Error communicating with API"):
             coordinator._classify_and_raise(Exception("Something went wrong"))
 
     @pytest.mark.asyncio
     async def test_auth_error_creates_repair_issue(
-        self, hass: HomeAssistant, mock_config_entry
+        self, hass: HomeAssistant, mock_config_entry, coordinator
     ):
         """Test that auth errors create repair issues."""
-        coordinator = LocaDataUpdateCoordinator(hass, mock_config_entry)
-
         with (
             patch(
                 "custom_components.loca.coordinator.async_create_api_auth_issue"
@@ -1,6 +1,8 @@
 """Tests for Loca device tracker."""
 
 from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 from homeassistant.core import HomeAssistant
@@ -59,9 +61,9 @@ class TestLocaDeviceTracker:
 
     def setup_method(self):
         """Set up test method."""
-        self.mock_coordinator = MagicMock()
-        self.device_id = "test_device"
-        self.device_tracker = LocaDeviceTracker(self.mock_coordinator, self.device_id)
+        # Any: the stub stands in for a LocaDataUpdateCoordinator
+        self.mock_coordinator: Any = SimpleNamespace(data={})
+        self.device_tracker = LocaDeviceTracker(self.mock_coordinator, "test_device")
 
     def test_init(self):
         """Test device tracker initialization."""
@@ -86,6 +88,15 @@ class TestLocaDeviceTracker:
 
         assert self.device_tracker.device_data == {}
 
+    def test_device_data_missing_reuses_empty_mapping(self):
+        """Test missing devices share one read-only empty mapping."""
+        self.mock_coordinator.data = {}
+
+        first = self.device_tracker.device_data
+        assert self.device_tracker.device_data is first
+        with pytest.raises(TypeError):
+            first["name"] = "mutated"  # type: ignore[index]
+
     def test_name_with_device_name(self):
         """Test name property with device name."""
         self.mock_coordinator.data = {"test_device": {"name": "My GPS Tracker"}}
@@ -205,46 +216,39 @@ class TestLocaDeviceTracker:
 
         assert device_info["name"] == "Loca Device test_device"
 
-    def test_coordinates_zero_values(self):
-        """Test coordinates with zero values."""
+    @pytest.mark.parametrize(
+        ("latitude", "longitude"),
+        [
+            pytest.param(0.0, 0.0, id="zero"),
+            pytest.param(-34.6037, -58.3816, id="negative"),
+        ],
+    )
+    def test_coordinates_edge_values(self, latitude, longitude):
+        """Test zero and negative coordinates are passed through unchanged."""
         self.mock_coordinator.data = {
-            "test_device": {
-                "latitude": 0.0,
-                "longitude": 0.0,
-            }
+            "test_device": {"latitude": latitude, "longitude": longitude}
         }
 
-        assert self.device_tracker.latitude == 0.0
-        assert self.device_tracker.longitude == 0.0
-
-    def test_coordinates_negative_values(self):
-        """Test coordinates with negative values."""
+        assert self.device_tracker.latitude == latitude
+        assert self.device_tracker.longitude == longitude
+
+    @pytest.mark.parametrize(
+        ("asset_type", "expected_icon"),
+        [
+            pytest.param(1, "mdi:car", id="car"),
+            pytest.param(9, "mdi:motorcycle", id="motorbike"),
+            pytest.param(999, "mdi:radar", id="unknown_type_falls_back"),
+        ],
+    )
+    def test_icon_property_dynamic_mapping(self, asset_type, expected_icon):
+        """Test icon property uses dynamic asset type mapping."""
         self.mock_coordinator.data = {
             "test_device": {
-                "latitude": -34.6037,
-                "longitude": -58.3816,
+                "asset_info": {"type": asset_type, "brand": "BMW", "model": "X3"}
             }
         }
 
-        assert self.device_tracker.latitude == -34.6037
-        assert self.device_tracker.longitude == -58.3816
-
-    def test_icon_property_dynamic_mapping(self):
-        """Test icon property uses dynamic asset type mapping."""
-        # Test car (type 1)
-        self.mock_coordinator.data = {
-            "test_device": {"asset_info": {"type": 1, "brand": "BMW", "model": "X3"}}
-        }
-
-        assert self.device_tracker.icon == "mdi:car"
-
-        # Test motorbike (type 9)
-        self.mock_coordinator.data["test_device"]["asset_info"]["type"] = 9
-        assert self.device_tracker.icon == "mdi:motorcycle"
-
-        # Test unknown type (fallback to radar)
-        self.mock_coordinator.data["test_device"]["asset_info"]["type"] = 999
-        assert self.device_tracker.icon == "mdi:radar"
+        assert self.device_tracker.icon == expected_icon
 
     def test_icon_property_no_asset_info(self):
         """Test icon property fallback when no asset info."""
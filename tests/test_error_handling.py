@@ -248,6 +248,44 @@ class TestHandleApiErrors:
 
         assert "My operation failed" in caplog.text
 
+    @pytest.mark.asyncio
+    async def test_connectivity_error_logs_warning(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test connectivity errors are logged as warnings without a traceback."""
+        from custom_components.loca.error_handling import handle_api_errors
+
+        @handle_api_errors(default_return=[], log_prefix="My operation")
+        async def my_func() -> list[str]:
+            raise TimeoutError("timeout while reading")
+
+        with caplog.at_level(logging.WARNING):
+            result = await my_func()
+
+        records = [
+            record
+            for record in caplog.records
+            if record.name == "custom_components.loca.error_handling"
+        ]
+        assert result == []
+        assert [record.levelno for record in records] == [logging.WARNING]
+        assert records[0].exc_info is None
+        assert "My operation failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_cancelled_error_propagates(self) -> None:
+        """Test task cancellation is not swallowed."""
+        import asyncio
+
+        from custom_components.loca.error_handling import handle_api_errors
+
+        @handle_api_errors(default_return=[])
+        async def my_func() -> list[str]:
+            raise asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            await my_func()
+
 
 class TestHandleConfigFlowErrors:
     """Test handle_config_flow_errors decorator."""
@@ -386,6 +424,35 @@ class TestHandleConfigFlowErrors:
         assert result["type"] == "form"
         assert result["step_id"] == "user"
 
+    @pytest.mark.asyncio
+    async def test_error_form_uses_mixin_defaults(self) -> None:
+        """Test the error form falls back to the mixin's step and schema."""
+        from custom_components.loca.error_handling import (
+            ConfigFlowErrorMixin,
+            handle_config_flow_errors,
+        )
+
+        class FakeFlow(ConfigFlowErrorMixin):
+            class CannotConnect(Exception):
+                pass
+
+            class InvalidAuth(Exception):
+                pass
+
+            def async_show_form(self, **kwargs):
+                return {"type": "form", **kwargs}
+
+        flow = FakeFlow()
+
+        @handle_config_flow_errors
+        async def step(self, user_input=None):
+            raise self.__class__.CannotConnect()
+
+        result = await step(flow, {"key": "value"})
+        assert result["step_id"] == "user"
+        assert result["data_schema"] == {}
+        assert result["errors"] == {"base": "cannot_connect"}
+
 
 class TestConfigFlowErrorMixin:
     """Test ConfigFlowErrorMixin class."""
@@ -462,6 +529,28 @@ class TestConfigFlowErrorMixin:
         result = flow.handle_validation_errors(failing_func, {})
         assert result == {"base": "unknown"}
 
+    def test_handle_validation_errors_bases_are_known(self) -> None:
+        """Test every mapped error base is one of ERROR_BASES."""
+        from custom_components.loca.error_handling import ConfigFlowErrorMixin
+        from custom_components.loca.types import ERROR_BASES
+
+        class FakeFlow(ConfigFlowErrorMixin):
+            class CannotConnect(Exception):
+                pass
+
+            class InvalidAuth(Exception):
+                pass
+
+        flow = FakeFlow()
+
+        for error in (FakeFlow.CannotConnect, FakeFlow.InvalidAuth, RuntimeError):
+
+            def failing_func(x, error=error):
+                raise error()
+
+            result = flow.handle_validation_errors(failing_func, {})
+            assert result["base"] in ERROR_BASES
+
 
 class TestConnectionErrorTypes:
     """Test CONNECTION_ERROR_TYPES constant."""
@@ -109,6 +109,16 @@ class TestRepairFlowCreation:
 
         assert isinstance(flow, ApiAuthenticationFailedRepairFlow)
 
+    @pytest.mark.asyncio
+    async def test_create_fix_flow_api_auth_with_entry_id(self, hass: HomeAssistant):
+        """Test the API auth fix flow targets the entry stored on the issue."""
+        flow = await async_create_fix_flow(
+            hass, "api_authentication_failed", {"entry_id": "test_entry_id"}
+        )
+
+        assert isinstance(flow, ApiAuthenticationFailedRepairFlow)
+        assert flow._entry_id == "test_entry_id"
+
     @pytest.mark.asyncio
     async def test_create_fix_flow_deprecated_yaml(self, hass: HomeAssistant):
         """Test creating fix flow for deprecated yaml issue."""
@@ -237,14 +247,12 @@ class TestRepairErrorHandling:
 class TestRepairIntegration:
     """Test integration between repairs and main components."""
 
-    @pytest.mark.asyncio
-    async def test_repair_triggered_by_coordinator_error(self):
+    def test_repair_triggered_by_coordinator_error(self):
         """Test that repairs are triggered by coordinator errors."""
         # This would test the integration with coordinator.py
         # where repairs are actually triggered
 
-    @pytest.mark.asyncio
-    async def test_repair_resolves_when_issue_fixed(self):
+    def test_repair_resolves_when_issue_fixed(self):
         """Test that repair issues are resolved when problem is fixed."""
         # This would test that issues are automatically deleted
         # when the underlying problem is resolved
@@ -3,13 +3,25 @@
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 import pytest
 
 from custom_components.loca.const import DOMAIN
-from custom_components.loca.sensor import SENSOR_TYPES, LocaSensor, async_setup_entry
+from custom_components.loca.sensor import (
+    _SENSOR_CLASSES,
+    SENSOR_TYPES,
+    LocaSensor,
+    _format_accuracy,
+    _format_frequency,
+    _format_time_of_day,
+    async_setup_entry,
+)
 
 
 class TestAsyncSetupEntry:
@@ -68,7 +80,7 @@ class TestLocaSensor:
 
     def test_init_battery_sensor(self):
         """Test battery sensor initialization."""
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
 
         assert sensor._device_id == "test_device"
         assert sensor._sensor_type == "battery"
@@ -80,7 +92,7 @@ class TestLocaSensor:
 
     def test_init_last_seen_sensor(self):
         """Test last seen sensor initialization."""
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "last_seen")
+        sensor = _SENSOR_CLASSES["last_seen"](self.mock_coordinator, self.device_id)
 
         assert sensor._sensor_type == "last_seen"
         assert sensor._attr_unique_id == f"{DOMAIN}_test_device_last_seen"
@@ -91,7 +103,9 @@ class TestLocaSensor:
 
     def test_init_location_accuracy_sensor(self):
         """Test location accuracy sensor initialization."""
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_accuracy")
+        sensor = _SENSOR_CLASSES["location_accuracy"](
+            self.mock_coordinator, self.device_id
+        )
 
         assert sensor._sensor_type == "location_accuracy"
         assert sensor._attr_unique_id == f"{DOMAIN}_test_device_location_accuracy"
@@ -108,21 +122,50 @@ class TestLocaSensor:
         }
         self.mock_coordinator.data = {"test_device": test_data}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         assert sensor.device_data == test_data
 
     def test_device_data_missing(self):
         """Test device_data property when device is missing."""
         self.mock_coordinator.data = {}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         assert sensor.device_data == {}
 
+    def test_device_data_refreshed_on_coordinator_update(self):
+        """Test the cached device snapshot follows coordinator updates."""
+        self.mock_coordinator.data = {"test_device": {"battery_level": 85}}
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
+        sensor.async_write_ha_state = MagicMock()  # type: ignore[method-assign]
+
+        self.mock_coordinator.data = {"test_device": {"battery_level": 40}}
+        assert sensor.native_value == 85
+
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 40
+        sensor.async_write_ha_state.assert_called_once()
+
+    def test_extra_state_attributes_reused_until_snapshot_replaced(self):
+        """Test attributes are rebuilt only when the device snapshot is replaced."""
+        device_data = {"location_source": "GPS", "speed": 10}
+        self.mock_coordinator.data = {"test_device": device_data}
+        sensor = _SENSOR_CLASSES["speed"](self.mock_coordinator, self.device_id)
+        sensor.async_write_ha_state = MagicMock()  # type: ignore[method-assign]
+        attributes = sensor.extra_state_attributes
+
+        # A failed update keeps the previous snapshot
+        sensor._handle_coordinator_update()
+        assert sensor.extra_state_attributes is attributes
+
+        self.mock_coordinator.data = {"test_device": {"location_source": "WiFi"}}
+        sensor._handle_coordinator_update()
+        assert sensor.extra_state_attributes == {"location_source": "WiFi"}
+
     def test_name_with_device_name(self):
         """Test name property with device name."""
         self.mock_coordinator.data = {"test_device": {"name": "My GPS Tracker"}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         # With _attr_has_entity_name = True, name comes from entity_description only
         assert sensor.name == "Battery"
 
@@ -130,7 +173,7 @@ class TestLocaSensor:
         """Test name property without device name."""
         self.mock_coordinator.data = {"test_device": {}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "last_seen")
+        sensor = _SENSOR_CLASSES["last_seen"](self.mock_coordinator, self.device_id)
         # With _attr_has_entity_name = True, name comes from entity_description only
         assert sensor.name == "Last Seen"
 
@@ -138,14 +181,14 @@ class TestLocaSensor:
         """Test native_value for battery sensor."""
         self.mock_coordinator.data = {"test_device": {"battery_level": 85}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == 85
 
     def test_native_value_battery_missing(self):
         """Test native_value for battery sensor when missing."""
         self.mock_coordinator.data = {"test_device": {}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         assert sensor.native_value is None
 
     def test_native_value_last_seen(self):
@@ -153,45 +196,46 @@ class TestLocaSensor:
         test_datetime = datetime(2022, 1, 1, 12, 0, 0)
         self.mock_coordinator.data = {"test_device": {"last_seen": test_datetime}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "last_seen")
+        sensor = _SENSOR_CLASSES["last_seen"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == test_datetime
 
     def test_native_value_last_seen_missing(self):
         """Test native_value for last seen sensor when missing."""
         self.mock_coordinator.data = {"test_device": {}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "last_seen")
+        sensor = _SENSOR_CLASSES["last_seen"](self.mock_coordinator, self.device_id)
         assert sensor.native_value is None
 
     def test_native_value_location_accuracy(self):
         """Test native_value for location accuracy sensor."""
         self.mock_coordinator.data = {"test_device": {"gps_accuracy": 5}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_accuracy")
+        sensor = _SENSOR_CLASSES["location_accuracy"](
+            self.mock_coordinator, self.device_id
+        )
         assert sensor.native_value == 5
 
     def test_native_value_location_accuracy_missing(self):
         """Test native_value for location accuracy sensor when missing."""
         self.mock_coordinator.data = {"test_device": {}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_accuracy")
+        sensor = _SENSOR_CLASSES["location_accuracy"](
+            self.mock_coordinator, self.device_id
+        )
         assert sensor.native_value is None
 
-    def test_native_value_unknown_sensor_type(self):
-        """Test native_value for unknown sensor type."""
-        self.mock_coordinator.data = {"test_device": {"some_value": 123}}
-
-        # This would normally not happen due to SENSOR_TYPES validation
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
-        sensor._sensor_type = "unknown"
-
-        assert sensor.native_value is None
+    def test_sensor_classes_cover_sensor_types(self):
+        """Test every sensor type has a dedicated LocaSensor subclass."""
+        assert set(_SENSOR_CLASSES) == set(SENSOR_TYPES)
+        for sensor_type, sensor_class in _SENSOR_CLASSES.items():
+            assert issubclass(sensor_class, LocaSensor)
+            assert sensor_class._sensor_type == sensor_type
 
     def test_extra_state_attributes_last_seen_sensor(self):
         """Test extra_state_attributes for last seen sensor."""
         self.mock_coordinator.data = {"test_device": {"location_source": "GPS"}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "last_seen")
+        sensor = _SENSOR_CLASSES["last_seen"](self.mock_coordinator, self.device_id)
         attributes = sensor.extra_state_attributes
 
         assert attributes == {"location_source": "GPS"}
@@ -200,7 +244,7 @@ class TestLocaSensor:
         """Test extra_state_attributes for last seen sensor without location source."""
         self.mock_coordinator.data = {"test_device": {}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "last_seen")
+        sensor = _SENSOR_CLASSES["last_seen"](self.mock_coordinator, self.device_id)
         attributes = sensor.extra_state_attributes
 
         assert attributes == {}
@@ -209,7 +253,7 @@ class TestLocaSensor:
         """Test extra_state_attributes for non-last_seen sensors."""
         self.mock_coordinator.data = {"test_device": {"location_source": "GPS"}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         attributes = sensor.extra_state_attributes
 
         assert attributes == {}
@@ -218,7 +262,7 @@ class TestLocaSensor:
         """Test device_info property."""
         self.mock_coordinator.data = {"test_device": {"name": "My GPS Tracker"}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         device_info = sensor.device_info
 
         assert isinstance(device_info, dict)  # DeviceInfo is TypedDict
@@ -231,7 +275,7 @@ class TestLocaSensor:
         """Test device_info property without device name."""
         self.mock_coordinator.data = {"test_device": {}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         device_info = sensor.device_info
 
         assert device_info["name"] == "Loca Device test_device"
@@ -240,7 +284,7 @@ class TestLocaSensor:
         """Test available property with valid data."""
         self.mock_coordinator.data = {"test_device": {"battery_level": 85}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
 
         # Mock the parent available property
         with patch.object(
@@ -256,7 +300,7 @@ class TestLocaSensor:
         # Mock the coordinator's last_update_success property to indicate failure
         self.mock_coordinator.last_update_success = False
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
 
         # CoordinatorEntity.available should be False if coordinator has update failure
         assert sensor.available is False
@@ -267,7 +311,7 @@ class TestLocaSensor:
         # Mock the coordinator's last_update_success property to indicate failure
         self.mock_coordinator.last_update_success = False
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
 
         # CoordinatorEntity.available should be False if coordinator has update failure
         assert sensor.available is False
@@ -276,7 +320,7 @@ class TestLocaSensor:
         """Test available property when parent is unavailable."""
         self.mock_coordinator.data = {"test_device": {"battery_level": 85}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
 
         # Mock the parent available property
         with patch.object(
@@ -293,7 +337,7 @@ class TestLocaSensor:
             "test_device": {"asset_info": {"type": 1, "brand": "BMW", "model": "X3"}}
         }
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "asset_info")
+        sensor = _SENSOR_CLASSES["asset_info"](self.mock_coordinator, self.device_id)
         assert sensor.icon == "mdi:car"
 
         # Test bicycle (type 2)
@@ -308,7 +352,7 @@ class TestLocaSensor:
         """Test icon property for non-asset sensors uses default."""
         self.mock_coordinator.data = {"test_device": {"battery_level": 85}}
 
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         assert sensor.icon == "mdi:battery"  # From SENSOR_TYPES
 
 
@@ -323,13 +367,13 @@ class TestLocaSensorNativeValues:
     def test_native_value_speed(self):
         """Test native_value for speed sensor."""
         self.mock_coordinator.data = {"test_device": {"speed": 65.5}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "speed")
+        sensor = _SENSOR_CLASSES["speed"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == 65.5
 
     def test_native_value_speed_missing(self):
         """Test native_value for speed sensor when missing."""
         self.mock_coordinator.data = {"test_device": {}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "speed")
+        sensor = _SENSOR_CLASSES["speed"](self.mock_coordinator, self.device_id)
         assert sensor.native_value is None
 
     def test_native_value_asset_info_brand_and_model(self):
@@ -337,7 +381,7 @@ class TestLocaSensorNativeValues:
         self.mock_coordinator.data = {
             "test_device": {"asset_info": {"brand": "BMW", "model": "X3"}}
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "asset_info")
+        sensor = _SENSOR_CLASSES["asset_info"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == "BMW X3"
 
     def test_native_value_asset_info_brand_only(self):
@@ -345,7 +389,7 @@ class TestLocaSensorNativeValues:
         self.mock_coordinator.data = {
             "test_device": {"asset_info": {"brand": "BMW", "model": ""}}
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "asset_info")
+        sensor = _SENSOR_CLASSES["asset_info"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == "BMW"
 
     def test_native_value_asset_info_model_only(self):
@@ -353,25 +397,27 @@ class TestLocaSensorNativeValues:
         self.mock_coordinator.data = {
             "test_device": {"asset_info": {"brand": "", "model": "X3"}}
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "asset_info")
+        sensor = _SENSOR_CLASSES["asset_info"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == "X3"
 
     def test_native_value_asset_info_unknown(self):
         """Test native_value for asset_info sensor with no info."""
         self.mock_coordinator.data = {"test_device": {"asset_info": {}}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "asset_info")
+        sensor = _SENSOR_CLASSES["asset_info"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == "Unknown Asset"
 
     def test_native_value_asset_info_missing(self):
         """Test native_value for asset_info sensor when asset_info is missing."""
         self.mock_coordinator.data = {"test_device": {}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "asset_info")
+        sensor = _SENSOR_CLASSES["asset_info"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == "Unknown Asset"
 
     def test_native_value_location_update_always_on(self):
         """Test native_value for location_update sensor with always on."""
         self.mock_coordinator.data = {"test_device": {"location_update": {"always": 1}}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         assert sensor.native_value == "Always on"
 
     def test_native_value_location_update_scheduled(self):
@@ -379,19 +425,25 @@ class TestLocaSensorNativeValues:
         self.mock_coordinator.data = {
             "test_device": {"location_update": {"always": 0, "frequency": 300}}
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         assert sensor.native_value == "Scheduled"
 
     def test_native_value_location_update_not_configured(self):
         """Test native_value for location_update sensor when not configured."""
         self.mock_coordinator.data = {"test_device": {}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         assert sensor.native_value == "Not configured"
 
     def test_native_value_location_update_empty_dict(self):
         """Test native_value for location_update sensor with empty dict."""
         self.mock_coordinator.data = {"test_device": {"location_update": {}}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         assert sensor.native_value == "Not configured"
 
     def test_native_value_location_with_address(self):
@@ -399,19 +451,19 @@ class TestLocaSensorNativeValues:
         self.mock_coordinator.data = {
             "test_device": {"address": "Test Street 42, Amsterdam"}
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location")
+        sensor = _SENSOR_CLASSES["location"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == "Test Street 42, Amsterdam"
 
     def test_native_value_location_without_address(self):
         """Test native_value for location sensor without address."""
         self.mock_coordinator.data = {"test_device": {}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location")
+        sensor = _SENSOR_CLASSES["location"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == "Unknown location"
 
     def test_native_value_location_empty_address(self):
         """Test native_value for location sensor with empty address."""
         self.mock_coordinator.data = {"test_device": {"address": ""}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location")
+        sensor = _SENSOR_CLASSES["location"](self.mock_coordinator, self.device_id)
         assert sensor.native_value == "Unknown location"
 
 
@@ -439,7 +491,7 @@ class TestLocaSensorExtraStateAttributes:
                 "address": "Test Street 42",
             }
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "asset_info")
+        sensor = _SENSOR_CLASSES["asset_info"](self.mock_coordinator, self.device_id)
         attrs = sensor.extra_state_attributes
 
         assert attrs["brand"] == "BMW"
@@ -454,7 +506,7 @@ class TestLocaSensorExtraStateAttributes:
     def test_asset_info_attributes_empty(self):
         """Test asset_info sensor with empty asset_info."""
         self.mock_coordinator.data = {"test_device": {}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "asset_info")
+        sensor = _SENSOR_CLASSES["asset_info"](self.mock_coordinator, self.device_id)
         attrs = sensor.extra_state_attributes
         assert attrs == {}
 
@@ -467,7 +519,7 @@ class TestLocaSensorExtraStateAttributes:
                 "gps_accuracy": 5,
             }
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "speed")
+        sensor = _SENSOR_CLASSES["speed"](self.mock_coordinator, self.device_id)
         attrs = sensor.extra_state_attributes
 
         assert attrs["location_source"] == "GPS"
@@ -477,7 +529,7 @@ class TestLocaSensorExtraStateAttributes:
     def test_speed_attributes_empty(self):
         """Test speed sensor with no attributes."""
         self.mock_coordinator.data = {"test_device": {}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "speed")
+        sensor = _SENSOR_CLASSES["speed"](self.mock_coordinator, self.device_id)
         attrs = sensor.extra_state_attributes
         assert attrs == {}
 
@@ -494,7 +546,9 @@ class TestLocaSensorExtraStateAttributes:
                 }
             }
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         attrs = sensor.extra_state_attributes
 
         assert attrs["always_on"] is True
@@ -517,7 +571,9 @@ class TestLocaSensorExtraStateAttributes:
                 }
             }
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         attrs = sensor.extra_state_attributes
         assert attrs["frequency_description"] == "2 hour(s)"
 
@@ -533,7 +589,9 @@ class TestLocaSensorExtraStateAttributes:
                 }
             }
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         attrs = sensor.extra_state_attributes
         assert attrs["frequency_description"] == "2 day(s)"
 
@@ -549,7 +607,9 @@ class TestLocaSensorExtraStateAttributes:
                 }
             }
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         attrs = sensor.extra_state_attributes
         assert attrs["frequency_description"] == "30 second(s)"
 
@@ -566,16 +626,33 @@ class TestLocaSensorExtraStateAttributes:
                 }
             }
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         attrs = sensor.extra_state_attributes
         # timeofday is not int/float, so update_time should not be in attrs
         assert "update_time" not in attrs
         assert attrs["frequency"] == 60
 
+    def test_location_update_attributes_timeofday_not_finite(self):
+        """Test location_update skips update_time for NaN or infinite timeofday."""
+        for timeofday in (float("nan"), float("inf")):
+            self.mock_coordinator.data = {
+                "test_device": {
+                    "location_update": {"frequency": 60, "timeofday": timeofday}
+                }
+            }
+            sensor = _SENSOR_CLASSES["location_update"](
+                self.mock_coordinator, self.device_id
+            )
+            assert "update_time" not in sensor.extra_state_attributes
+
     def test_location_update_attributes_empty(self):
         """Test location_update with empty config."""
         self.mock_coordinator.data = {"test_device": {}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_update")
+        sensor = _SENSOR_CLASSES["location_update"](
+            self.mock_coordinator, self.device_id
+        )
         attrs = sensor.extra_state_attributes
         assert attrs == {}
 
@@ -596,7 +673,7 @@ class TestLocaSensorExtraStateAttributes:
                 "satellites": 8,
             }
         }
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location")
+        sensor = _SENSOR_CLASSES["location"](self.mock_coordinator, self.device_id)
         attrs = sensor.extra_state_attributes
 
         assert attrs["street"] == "Test Street"
@@ -613,79 +690,97 @@ class TestLocaSensorExtraStateAttributes:
     def test_location_attributes_empty(self):
         """Test location sensor with no attributes."""
         self.mock_coordinator.data = {"test_device": {}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location")
+        sensor = _SENSOR_CLASSES["location"](self.mock_coordinator, self.device_id)
         attrs = sensor.extra_state_attributes
         assert attrs == {}
 
     def test_battery_sensor_no_extra_attributes(self):
         """Test battery sensor has no extra attributes."""
         self.mock_coordinator.data = {"test_device": {"battery_level": 85}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, self.device_id)
         attrs = sensor.extra_state_attributes
         assert attrs == {}
 
     def test_location_accuracy_sensor_no_extra_attributes(self):
         """Test location_accuracy sensor has no extra attributes."""
         self.mock_coordinator.data = {"test_device": {"gps_accuracy": 5}}
-        sensor = LocaSensor(self.mock_coordinator, self.device_id, "location_accuracy")
+        sensor = _SENSOR_CLASSES["location_accuracy"](
+            self.mock_coordinator, self.device_id
+        )
         attrs = sensor.extra_state_attributes
         assert attrs == {}
 
 
 class TestLocaSensorFormatTimeOfDay:
-    """Test the _format_time_of_day method."""
-
-    def setup_method(self):
-        """Set up test method."""
-        self.mock_coordinator = MagicMock()
-        self.mock_coordinator.data = {"test_device": {}}
-        self.sensor = LocaSensor(
-            self.mock_coordinator, "test_device", "location_update"
-        )
+    """Test the _format_time_of_day helper."""
 
     def test_format_time_hhmm00_format(self):
         """Test formatting HHMM00 format (e.g., 91000 = 9:10)."""
-        result = self.sensor._format_time_of_day(91000)
+        result = _format_time_of_day(91000)
         assert result == "09:10"
 
     def test_format_time_hhmm00_two_digit_hour(self):
         """Test formatting HHMM00 with two-digit hour (e.g., 143000 = 14:30)."""
-        result = self.sensor._format_time_of_day(143000)
+        result = _format_time_of_day(143000)
         assert result == "14:30"
 
     def test_format_time_small_value_as_seconds(self):
         """Test formatting small value as seconds since midnight."""
         # 500 seconds = 8 minutes, 20 seconds -> 00:08
-        result = self.sensor._format_time_of_day(500)
+        result = _format_time_of_day(500)
         assert result == "00:08"
 
     def test_format_time_zero(self):
         """Test formatting zero value."""
-        result = self.sensor._format_time_of_day(0)
+        result = _format_time_of_day(0)
         assert result == "00:00"
 
     def test_format_time_1000_boundary(self):
         """Test formatting at the 1000 boundary (HHMM00 format)."""
         # 1000 -> hours = 0, minutes = (1000 % 10000) // 100 = 10
-        result = self.sensor._format_time_of_day(1000)
+        result = _format_time_of_day(1000)
         assert result == "00:10"
 
     def test_format_time_float_value(self):
         """Test formatting with float value."""
-        result = self.sensor._format_time_of_day(91000.5)
+        result = _format_time_of_day(91000.5)
         assert result == "09:10"
 
-    def test_format_time_invalid_string(self):
-        """Test formatting with invalid string value."""
-        result = self.sensor._format_time_of_day("invalid")  # type: ignore[arg-type]
-        assert result is None
-
     def test_format_time_negative_fallback(self):
         """Test formatting with negative value (fallback branch)."""
         # Negative value in fallback branch: abs(-500) % 86400 = 500
-        result = self.sensor._format_time_of_day(-500)
+        result = _format_time_of_day(-500)
         assert result == "00:08"
 
+    def test_format_time_is_cached(self):
+        """Test repeated timeofday values are served from the cache."""
+        _format_time_of_day.cache_clear()
+        _format_time_of_day(91000)
+        _format_time_of_day(91000)
+        assert _format_time_of_day.cache_info().hits == 1
+
+
+class TestLocaSensorFormatFrequency:
+    """Test the _format_frequency helper."""
+
+    def test_format_frequency_int_and_float_cached_separately(self):
+        """Test equal int and float frequencies keep their own description."""
+        _format_frequency.cache_clear()
+        assert _format_frequency(60) == "1 minute(s)"
+        assert _format_frequency(60.0) == "1.0 minute(s)"
+        assert _format_frequency.cache_info().hits == 0
+
+
+class TestLocaSensorFormatAccuracy:
+    """Test the _format_accuracy helper."""
+
+    def test_format_accuracy_int_and_float_cached_separately(self):
+        """Test equal int and float accuracies keep their own formatting."""
+        _format_accuracy.cache_clear()
+        assert _format_accuracy(5) == "5m"
+        assert _format_accuracy(5.0) == "5.0m"
+        assert _format_accuracy.cache_info().hits == 0
+
 
 class TestLocaSensorAvailable:
     """Test the available property edge cases."""
@@ -698,7 +793,7 @@ class TestLocaSensorAvailable:
         """Test available when device is in coordinator data and parent is available."""
         self.mock_coordinator.data = {"test_device": {"battery_level": 85}}
         self.mock_coordinator.last_update_success = True
-        sensor = LocaSensor(self.mock_coordinator, "test_device", "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, "test_device")
         # The sensor should be available since device is in data
         # (parent available depends on coordinator.last_update_success)
         assert sensor.available is True
@@ -707,10 +802,19 @@ class TestLocaSensorAvailable:
         """Test available when device is not in coordinator data."""
         self.mock_coordinator.data = {"other_device": {"battery_level": 85}}
         self.mock_coordinator.last_update_success = True
-        sensor = LocaSensor(self.mock_coordinator, "test_device", "battery")
+        sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, "test_device")
         # Device not in data -> unavailable regardless of parent
         assert sensor.available is False
 
+    def test_available_derived_sensor_without_source_data(self):
+        """Test sensors with derived values stay available without source data."""
+        self.mock_coordinator.data = {"test_device": {}}
+        self.mock_coordinator.last_update_success = True
+        sensor = _SENSOR_CLASSES["location"](self.mock_coordinator, "test_device")
+
+        assert sensor.available is True
+        assert sensor.native_value == "Unknown location"
+
 
 class TestLocaSensorName:
     """Test name property edge cases."""
@@ -722,19 +826,34 @@ class TestLocaSensorName:
 
     def test_name_returns_none_for_empty_name(self):
         """Test name returns None when entity_description.name is empty string."""
-        sensor = LocaSensor(self.mock_coordinator, "test_device", "battery")
-        # Override entity_description name to empty string
-        sensor.entity_description = MagicMock()
-        sensor.entity_description.name = ""
+        description = SensorEntityDescription(key="battery", name="")
+        with patch.object(
+            _SENSOR_CLASSES["battery"], "entity_description", description
+        ):
+            sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, "test_device")
         assert sensor.name is None
 
     def test_name_returns_none_for_none_name(self):
         """Test name returns None when entity_description.name is None."""
-        sensor = LocaSensor(self.mock_coordinator, "test_device", "battery")
-        sensor.entity_description = MagicMock()
-        sensor.entity_description.name = None
+        description = SensorEntityDescription(key="battery", name=None)
+        with patch.object(
+            _SENSOR_CLASSES["battery"], "entity_description", description
+        ):
+            sensor = _SENSOR_CLASSES["battery"](self.mock_coordinator, "test_device")
         assert sensor.name is None
 
+    def test_name_and_icon_precomputed(self):
+        """Test name and icon are resolved once at construction."""
+        sensor = _SENSOR_CLASSES["speed"](self.mock_coordinator, "test_device")
+        assert sensor._attr_name == "Speed"
+        assert sensor._attr_icon == "mdi:speedometer"
+
+    def test_entity_description_shared_per_class(self):
+        """Test the entity description lives on the subclass, not the instance."""
+        sensor = _SENSOR_CLASSES["speed"](self.mock_coordinator, "test_device")
+        assert "entity_description" not in vars(sensor)
+        assert sensor.entity_description is SENSOR_TYPES["speed"]
+
 
 class TestLocaSensorAsyncAddNewDevices:
     """Test the _async_add_new_devices listener in sensor setup."""
@@ -849,3 +968,10 @@ class TestSensorTypes:
         assert accuracy_config.native_unit_of_measurement == "m"
         assert accuracy_config.state_class == SensorStateClass.MEASUREMENT
         assert accuracy_config.icon == "mdi:crosshairs-gps"
+
+    def test_parallel_updates_disabled(self):
+        """Test the platform opts out of the per-entity update semaphore."""
+        from custom_components.loca import sensor
+
+        assert sensor.PARALLEL_UPDATES == 0
+        assert "parallel_updates" not in vars(LocaSensor)
@@ -1,22 +1,54 @@
 """Tests for Loca services functionality."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers.update_coordinator import UpdateFailed
 import pytest
+import voluptuous as vol
 
 from custom_components.loca.const import DOMAIN
+from custom_components.loca.coordinator import LocaDataUpdateCoordinator
 from custom_components.loca.error_handling import LocaAPIUnavailableError
 from custom_components.loca.services import (
     SERVICE_FORCE_UPDATE,
     SERVICE_REFRESH_DEVICES,
+    _SERVICES_KEY,
+    _LocaServices,
     async_setup_services,
     async_unload_services,
 )
 
 
+def _coordinator_with_status(
+    hass: HomeAssistant, config_entry, status: list | Exception
+) -> LocaDataUpdateCoordinator:
+    """Build a real coordinator whose status list returns or raises `status`.
+
+    The coordinator turns errors into a failed update rather than raising them
+    from async_refresh, just as it does in production.
+    """
+    coordinator = LocaDataUpdateCoordinator(hass, config_entry)
+    coordinator.api._authenticated = True
+    coordinator.api.update_groups_cache = AsyncMock()  # type: ignore[method-assign]
+    if isinstance(status, Exception):
+        coordinator.api.get_status_list = AsyncMock(side_effect=status)  # type: ignore[method-assign]
+    else:
+        coordinator.api.get_status_list = AsyncMock(return_value=status)  # type: ignore[method-assign]
+    return coordinator
+
+
+def _loca_entry(entry_id: str, coordinator: LocaDataUpdateCoordinator) -> MagicMock:
+    """Return a Loca config entry stub carrying `coordinator`."""
+    entry = MagicMock()
+    entry.domain = DOMAIN
+    entry.entry_id = entry_id
+    entry.runtime_data = coordinator
+    return entry
+
+
 class TestServiceSetup:
     """Test service setup and unload functions."""
 
@@ -44,6 +76,48 @@ class TestServiceSetup:
         assert not hass.services.has_service(DOMAIN, SERVICE_REFRESH_DEVICES)
         assert not hass.services.has_service(DOMAIN, SERVICE_FORCE_UPDATE)
 
+    @pytest.mark.asyncio
+    async def test_setup_services_is_idempotent(self, hass: HomeAssistant):
+        """Test a second setup does not re-register existing services."""
+        await async_setup_services(hass)
+
+        with patch.object(hass.services, "async_register") as mock_register:
+            await async_setup_services(hass)
+
+        mock_register.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_setup_services_restores_missing_service(self, hass: HomeAssistant):
+        """Test a re-registered service shares the stored handler instance."""
+        await async_setup_services(hass)
+        hass.services.async_remove(DOMAIN, SERVICE_FORCE_UPDATE)
+
+        await async_setup_services(hass)
+
+        services = hass.services.async_services_for_domain(DOMAIN)
+        stored = hass.data[_SERVICES_KEY]
+        # Bound methods compare equal only when bound to the same instance
+        assert services[SERVICE_REFRESH_DEVICES].job.target == (
+            stored.async_refresh_devices
+        )
+        assert services[SERVICE_FORCE_UPDATE].job.target == stored.async_force_update
+
+    @pytest.mark.asyncio
+    async def test_unload_services_drops_stored_instance(self, hass: HomeAssistant):
+        """Test unloading forgets the instance so the next setup starts fresh."""
+        await async_setup_services(hass)
+        await async_unload_services(hass)
+
+        assert _SERVICES_KEY not in hass.data
+
+    @pytest.mark.asyncio
+    async def test_unload_services_when_not_registered(self, hass: HomeAssistant):
+        """Test unloading skips services that are not registered."""
+        with patch.object(hass.services, "async_remove") as mock_remove:
+            await async_unload_services(hass)
+
+        mock_remove.assert_not_called()
+
 
 class TestRefreshDevicesService:
     """Test refresh devices service."""
@@ -52,7 +126,7 @@ class TestRefreshDevicesService:
     def mock_coordinator(self):
         """Create a mock coordinator."""
         coordinator = MagicMock()
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
         return coordinator
 
     @pytest.fixture
@@ -89,7 +163,7 @@ class TestRefreshDevicesService:
             )
 
             # Should refresh the coordinator
-            mock_coordinator.async_request_refresh.assert_called_once()
+            mock_coordinator.async_refresh.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_refresh_devices_no_entries(self, hass: HomeAssistant):
@@ -132,6 +206,33 @@ class TestRefreshDevicesService:
                     DOMAIN, SERVICE_REFRESH_DEVICES, {}, blocking=True
                 )
 
+    @pytest.mark.asyncio
+    async def test_refresh_devices_entry_not_loaded(self, hass: HomeAssistant):
+        """Test refresh devices with a Loca entry that never finished setup."""
+        await async_setup_services(hass)
+
+        not_set_up = MagicMock(spec=["domain", "entry_id"])
+        not_set_up.domain = DOMAIN
+        not_set_up.entry_id = "test_entry_123"
+
+        with (
+            patch.object(
+                hass.config_entries, "async_get_entry", return_value=not_set_up
+            ),
+            patch(
+                "custom_components.loca.services.async_extract_config_entry_ids",
+                new_callable=AsyncMock,
+                return_value=["test_entry_123"],
+            ),
+        ):
+            with pytest.raises(
+                ServiceValidationError,
+                match="Config entry test_entry_123 is not loaded",
+            ):
+                await hass.services.async_call(
+                    DOMAIN, SERVICE_REFRESH_DEVICES, {}, blocking=True
+                )
+
     @pytest.mark.asyncio
     async def test_refresh_devices_coordinator_error(
         self, hass: HomeAssistant, mock_config_entry, mock_coordinator
@@ -141,7 +242,7 @@ class TestRefreshDevicesService:
         await async_setup_services(hass)
 
         # Make coordinator fail
-        mock_coordinator.async_request_refresh.side_effect = Exception("Refresh failed")
+        mock_coordinator.async_refresh.side_effect = OSError("Refresh failed")
 
         with (
             patch.object(
@@ -162,6 +263,102 @@ class TestRefreshDevicesService:
                 )
 
 
+class TestRefreshDevicesFailures:
+    """Test refresh devices against coordinators whose update fails."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_devices_partial_failure(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test one failing entry does not fail the refresh of the others."""
+        await async_setup_services(hass)
+
+        healthy = _coordinator_with_status(hass, mock_config_entry, [])
+        failing = _coordinator_with_status(hass, mock_config_entry, ValueError("boom"))
+        entries = {
+            "entry_ok": _loca_entry("entry_ok", healthy),
+            "entry_failing": _loca_entry("entry_failing", failing),
+        }
+
+        with (
+            patch.object(
+                hass.config_entries, "async_get_entry", side_effect=entries.get
+            ),
+            patch(
+                "custom_components.loca.services.async_extract_config_entry_ids",
+                new_callable=AsyncMock,
+                return_value=list(entries),
+            ),
+        ):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_REFRESH_DEVICES, {}, blocking=True
+            )
+
+        assert healthy.last_update_success
+        assert not failing.last_update_success
+
+    @pytest.mark.asyncio
+    async def test_refresh_devices_all_entries_fail(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test the service fails when no entry could be refreshed."""
+        await async_setup_services(hass)
+
+        failing = _coordinator_with_status(hass, mock_config_entry, ValueError("boom"))
+        entries = {"entry_failing": _loca_entry("entry_failing", failing)}
+
+        with (
+            patch.object(
+                hass.config_entries, "async_get_entry", side_effect=entries.get
+            ),
+            patch(
+                "custom_components.loca.services.async_extract_config_entry_ids",
+                new_callable=AsyncMock,
+                return_value=list(entries),
+            ),
+            pytest.raises(HomeAssistantError, match="Failed to refresh devices"),
+        ):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_REFRESH_DEVICES, {}, blocking=True
+            )
+
+    @pytest.mark.asyncio
+    async def test_refresh_devices_api_unavailable_cancels_siblings(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test an unavailable API cancels the other pending refreshes."""
+        await async_setup_services(hass)
+
+        failing = _coordinator_with_status(
+            hass, mock_config_entry, LocaAPIUnavailableError("API down")
+        )
+        never_done = asyncio.Event()
+        pending = MagicMock()
+        pending.async_refresh = AsyncMock(side_effect=never_done.wait)
+        entries = {
+            "entry_failing": _loca_entry("entry_failing", failing),
+            "entry_pending": _loca_entry("entry_pending", pending),
+        }
+
+        with (
+            patch.object(
+                hass.config_entries, "async_get_entry", side_effect=entries.get
+            ),
+            patch(
+                "custom_components.loca.services.async_extract_config_entry_ids",
+                new_callable=AsyncMock,
+                return_value=list(entries),
+            ),
+            pytest.raises(HomeAssistantError, match="temporarily unavailable"),
+        ):
+            await asyncio.wait_for(
+                hass.services.async_call(
+                    DOMAIN, SERVICE_REFRESH_DEVICES, {}, blocking=True
+                ),
+                timeout=5,
+            )
+
+
 class TestForceUpdateService:
     """Test force update service."""
 
@@ -177,7 +374,7 @@ class TestForceUpdateService:
                 "longitude": 4.5678,
             }
         }
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
         return coordinator
 
     @pytest.fixture
@@ -211,7 +408,7 @@ class TestForceUpdateService:
             )
 
             # Should refresh the coordinator
-            mock_coordinator_with_device.async_request_refresh.assert_called_once()
+            mock_coordinator_with_device.async_refresh.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_force_update_device_not_found(self, hass: HomeAssistant):
@@ -259,9 +456,9 @@ class TestForceUpdateService:
         await async_setup_services(hass)
 
         with patch.object(hass.config_entries, "async_entries", return_value=[]):
-            # Call the service with empty device_id
+            # Empty device_id is rejected by the service schema
             call_data = {"device_id": ""}
-            with pytest.raises(HomeAssistantError, match="Device ID is required"):
+            with pytest.raises(vol.Invalid):
                 await hass.services.async_call(
                     DOMAIN, SERVICE_FORCE_UPDATE, call_data, blocking=True
                 )
@@ -312,7 +509,61 @@ class TestForceUpdateService:
             )
 
             # Should find device in second entry and refresh that coordinator
-            mock_coordinator_with_device.async_request_refresh.assert_called_once()
+            mock_coordinator_with_device.async_refresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_force_update_uses_device_index(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_with_device,
+        mock_coordinator_with_device,
+    ):
+        """Test device lookups are served from the index after the first scan."""
+        services = _LocaServices(hass)
+        mock_config_entry_with_device.entry_id = "test_entry_123"
+
+        with (
+            patch.object(
+                hass.config_entries,
+                "async_entries",
+                return_value=[mock_config_entry_with_device],
+            ) as mock_entries,
+            patch.object(
+                hass.config_entries,
+                "async_get_entry",
+                return_value=mock_config_entry_with_device,
+            ),
+        ):
+            for _ in range(2):
+                assert (
+                    services._coordinator_for_device("test_device_123")
+                    is mock_coordinator_with_device
+                )
+
+            assert mock_entries.call_count == 1
+
+            # A device that left its entry triggers a rescan and is not found
+            mock_coordinator_with_device.data = {}
+            assert services._coordinator_for_device("test_device_123") is None
+            assert mock_entries.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_force_update_skips_entries_without_runtime_data(
+        self, hass: HomeAssistant, mock_config_entry_with_device
+    ):
+        """Test entries that never finished setup are ignored by the lookup."""
+        services = _LocaServices(hass)
+        not_set_up = MagicMock(spec=["domain", "entry_id"])
+
+        with patch.object(
+            hass.config_entries,
+            "async_entries",
+            return_value=[not_set_up, mock_config_entry_with_device],
+        ):
+            assert (
+                services._coordinator_for_device("test_device_123")
+                is mock_config_entry_with_device.runtime_data
+            )
 
     @pytest.mark.asyncio
     async def test_force_update_coordinator_error(
@@ -326,7 +577,7 @@ class TestForceUpdateService:
         await async_setup_services(hass)
 
         # Make coordinator fail
-        mock_coordinator_with_device.async_request_refresh.side_effect = Exception(
+        mock_coordinator_with_device.async_refresh.side_effect = OSError(
             "Update failed"
         )
 
@@ -345,6 +596,83 @@ class TestForceUpdateService:
                 )
 
 
+class TestForceUpdateFailures:
+    """Test force update against coordinators whose update fails."""
+
+    @pytest.mark.asyncio
+    async def test_force_update_failed_update(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test a failed coordinator update fails the force update."""
+        await async_setup_services(hass)
+
+        failing = _coordinator_with_status(hass, mock_config_entry, ValueError("boom"))
+        failing.data = {"test_device_123": {}}
+        entry = _loca_entry("entry_failing", failing)
+
+        with (
+            patch.object(hass.config_entries, "async_entries", return_value=[entry]),
+            pytest.raises(HomeAssistantError, match="Failed to force update device"),
+        ):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_FORCE_UPDATE,
+                {"device_id": "test_device_123"},
+                blocking=True,
+            )
+
+    @pytest.mark.asyncio
+    async def test_force_update_api_unavailable(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test an unavailable API is reported by the force update."""
+        await async_setup_services(hass)
+
+        failing = _coordinator_with_status(
+            hass, mock_config_entry, LocaAPIUnavailableError("API down")
+        )
+        failing.data = {"test_device_123": {}}
+        entry = _loca_entry("entry_failing", failing)
+
+        with (
+            patch.object(hass.config_entries, "async_entries", return_value=[entry]),
+            pytest.raises(HomeAssistantError, match="temporarily unavailable"),
+        ):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_FORCE_UPDATE,
+                {"device_id": "test_device_123"},
+                blocking=True,
+            )
+
+    @pytest.mark.asyncio
+    async def test_force_update_success_after_failure(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test the outcome reported is that of this refresh, not the last one."""
+        await async_setup_services(hass)
+
+        coordinator = _coordinator_with_status(
+            hass, mock_config_entry, ValueError("boom")
+        )
+        coordinator.data = {"test_device_123": {}}
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+
+        coordinator.api.get_status_list = AsyncMock(return_value=[])  # type: ignore[method-assign]
+        entry = _loca_entry("entry_recovered", coordinator)
+
+        with patch.object(hass.config_entries, "async_entries", return_value=[entry]):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_FORCE_UPDATE,
+                {"device_id": "test_device_123"},
+                blocking=True,
+            )
+
+        assert coordinator.last_update_success
+
+
 class TestServiceValidation:
     """Test service validation and error handling."""
 
@@ -357,8 +685,7 @@ class TestServiceValidation:
         assert hass.services.has_service(DOMAIN, SERVICE_REFRESH_DEVICES)
         assert hass.services.has_service(DOMAIN, SERVICE_FORCE_UPDATE)
 
-    @pytest.mark.asyncio
-    async def test_service_constants_defined(self):
+    def test_service_constants_defined(self):
         """Test that service constants are properly defined."""
         assert SERVICE_REFRESH_DEVICES == "refresh_devices"
         assert SERVICE_FORCE_UPDATE == "force_update"
@@ -388,7 +715,7 @@ class TestServiceIntegration:
 
         # Mock config entries to cause an error
         with patch.object(
-            hass.config_entries, "async_entries", side_effect=Exception("Test error")
+            hass.config_entries, "async_entries", side_effect=KeyError("Test error")
         ):
             call_data = {"device_id": "test_device"}
             with pytest.raises(HomeAssistantError):
@@ -399,6 +726,20 @@ class TestServiceIntegration:
             # Check that error was logged
             assert "Unexpected error force updating device" in caplog.text
 
+    @pytest.mark.asyncio
+    async def test_service_unknown_error_propagates(self, hass: HomeAssistant):
+        """Test that errors outside the handled set are not wrapped."""
+        await async_setup_services(hass)
+
+        with patch.object(
+            hass.config_entries, "async_entries", side_effect=RuntimeError("boom")
+        ):
+            call_data = {"device_id": "test_device"}
+            with pytest.raises(RuntimeError, match="boom"):
+                await hass.services.async_call(
+                    DOMAIN, SERVICE_FORCE_UPDATE, call_data, blocking=True
+                )
+
 
 class TestServiceSpecificErrors:
     """Test service handling of specific error types."""
@@ -413,7 +754,7 @@ class TestServiceSpecificErrors:
                 "name": "Test Device",
             }
         }
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
         return coordinator
 
     @pytest.fixture
@@ -435,7 +776,7 @@ class TestServiceSpecificErrors:
         """Test refresh when API is unavailable."""
         await async_setup_services(hass)
 
-        mock_coordinator_with_device.async_request_refresh.side_effect = (
+        mock_coordinator_with_device.async_refresh.side_effect = (
             LocaAPIUnavailableError("API temporarily unavailable")
         )
 
@@ -468,7 +809,7 @@ class TestServiceSpecificErrors:
         """Test refresh when coordinator update fails."""
         await async_setup_services(hass)
 
-        mock_coordinator_with_device.async_request_refresh.side_effect = UpdateFailed(
+        mock_coordinator_with_device.async_refresh.side_effect = UpdateFailed(
             "Failed to communicate with API"
         )
 
@@ -501,7 +842,7 @@ class TestServiceSpecificErrors:
         """Test force update when API is unavailable."""
         await async_setup_services(hass)
 
-        mock_coordinator_with_device.async_request_refresh.side_effect = (
+        mock_coordinator_with_device.async_refresh.side_effect = (
             LocaAPIUnavailableError("Cannot connect to Loca API")
         )
 
@@ -529,7 +870,7 @@ class TestServiceSpecificErrors:
         """Test force update when coordinator update fails."""
         await async_setup_services(hass)
 
-        mock_coordinator_with_device.async_request_refresh.side_effect = UpdateFailed(
+        mock_coordinator_with_device.async_refresh.side_effect = UpdateFailed(
             "Communication error"
         )
 
@@ -554,7 +895,7 @@ class TestServiceSpecificErrors:
 
         coordinator = MagicMock()
         coordinator.data = None  # Data not yet loaded
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
 
         entry = MagicMock()
         entry.domain = DOMAIN
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import pytest
 
 from custom_components.loca.const import LocationConstants
@@ -157,6 +159,13 @@ class TestValidateBatteryLevel:
         """Test that invalid string returns None."""
         assert DataValidator.validate_battery_level("invalid") is None
 
+    def test_battery_level_bool(self) -> None:
+        """Test that bools are converted to plain ints."""
+        for value, expected in ((True, 1), (False, 0)):
+            result = DataValidator.validate_battery_level(value)
+            assert result == expected
+            assert type(result) is int
+
 
 class TestValidateGpsAccuracy:
     """Test GPS accuracy validation."""
@@ -191,6 +200,13 @@ class TestValidateGpsAccuracy:
         result = DataValidator.validate_gps_accuracy("invalid")
         assert result == LocationConstants.DEFAULT_GPS_ACCURACY
 
+    def test_accuracy_bool(self) -> None:
+        """Test that bools are converted to plain ints clamped to minimum 1."""
+        for value in (True, False):
+            result = DataValidator.validate_gps_accuracy(value)
+            assert result == 1
+            assert type(result) is int
+
 
 class TestValidateDeviceId:
     """Test device ID validation."""
@@ -207,6 +223,20 @@ class TestValidateDeviceId:
         """Test that whitespace is stripped."""
         assert DataValidator.validate_device_id("  12345  ") == "12345"
 
+    def test_device_id_trailing_newline_stripped(self) -> None:
+        """Test that non-space whitespace at either end is stripped too."""
+        assert DataValidator.validate_device_id("\t12345\n") == "12345"
+
+    def test_device_id_true(self) -> None:
+        """Test that a True device ID is stringified."""
+        assert DataValidator.validate_device_id(True) == "True"
+
+    def test_device_id_false(self) -> None:
+        """Test rejection of a False device ID."""
+        with pytest.raises(ValidationError) as exc_info:
+            DataValidator.validate_device_id(False)
+        assert "cannot be empty" in str(exc_info.value)
+
     def test_device_id_empty(self) -> None:
         """Test rejection of empty device ID."""
         with pytest.raises(ValidationError) as exc_info:
@@ -241,6 +271,15 @@ class TestValidateStatusEntry:
         assert result["History"]["latitude"] == 52.0
         assert result["Spot"]["city"] == "Amsterdam"
 
+    def test_status_entry_returns_new_dict(self) -> None:
+        """Test the validated entry never aliases the caller's dict."""
+        entry = {"Asset": {"id": "12345"}, "History": {}, "Spot": {}}
+        result = DataValidator.validate_status_entry(entry)
+        assert result is not entry
+
+        result["History"] = {"latitude": 52.0}
+        assert entry["History"] == {}
+
     def test_status_entry_missing_history(self) -> None:
         """Test validation with missing History."""
         entry = {
@@ -251,6 +290,18 @@ class TestValidateStatusEntry:
         assert result["History"] == {}
         assert result["Spot"] == {}
 
+    def test_status_entry_dict_subclass(self) -> None:
+        """Test that dict subclasses are accepted as status entries."""
+        entry = OrderedDict(
+            Asset=OrderedDict(id="12345"),
+            History=OrderedDict(latitude=52.0),
+            Spot=OrderedDict(city="Amsterdam"),
+        )
+        result = DataValidator.validate_status_entry(entry)
+        assert result["Asset"]["id"] == "12345"
+        assert result["History"]["latitude"] == 52.0
+        assert result["Spot"]["city"] == "Amsterdam"
+
     def test_status_entry_not_dict(self) -> None:
         """Test rejection of non-dict status entry."""
         with pytest.raises(ValidationError) as exc_info:
@@ -312,6 +363,13 @@ class TestValidateLocationEntry:
         assert result["latitude"] == 0.0
         assert result["longitude"] == 0.0
 
+    def test_location_entry_dict_subclass(self) -> None:
+        """Test that dict subclasses are accepted as location entries."""
+        entry = OrderedDict(id="1", label="Home")
+        result = DataValidator.validate_location_entry(entry)
+        assert result["id"] == "1"
+        assert result["label"] == "Home"
+
     def test_location_entry_not_dict(self) -> None:
         """Test rejection of non-dict location entry."""
         with pytest.raises(ValidationError) as exc_info: